@@ -0,0 +1,148 @@
+"""
+LINDI helpers shared by the sync_dandi_incremental and sync_lindi_metadata
+commands.
+
+The leading underscore keeps Django from registering this module as a
+management command.
+"""
+import itertools
+import json
+import re
+from typing import Any, Callable, Optional, Tuple
+
+from django.db import transaction
+
+# orjson decodes large LINDI documents several times faster when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from dandisets.models import LindiMetadata
+
+# Control characters (except normal whitespace: \t, \n, \r) and literal
+# \u0000-\u001F escape sequences, stripped from LINDI strings in one pass
+LINDI_PROBLEMATIC_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]|\\u00[01][0-9a-fA-F]')
+
+# Literal escape sequences for control characters other than \t, \n and \r
+# (\u0000-\u0008, \u000b, \u000c, \u000e-\u001f); refs containing one are dropped
+LINDI_PROBLEMATIC_ESCAPE_RE = re.compile(r'\\u00(?:0[0-8bcef]|1[0-9a-f])')
+
+# LindiMetadata columns overwritten on re-processing; processed_at keeps the
+# first processing time, as update_or_create did
+LINDI_UPSERT_FIELDS = ['structure_metadata', 'lindi_url', 'processing_version', 'sync_tracker']
+
+
+def loads_json(content: bytes) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+
+    orjson rejects the NaN/Infinity literals that zarr metadata inside LINDI
+    files can contain, so such documents fall back to the stdlib decoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def has_problematic_unicode(text):
+    """Check if text contains problematic Unicode escape sequences"""
+    if not isinstance(text, str):
+        return False
+
+    return LINDI_PROBLEMATIC_ESCAPE_RE.search(text) is not None
+
+
+def clean_json_data(data):
+    """Recursively clean JSON data to remove problematic characters
+
+    Strings, dicts and lists that need no cleaning are returned as-is, and
+    a container is only copied from its first changed entry on, so the
+    common all-clean document is walked without allocating anything.
+    """
+    if isinstance(data, str):
+        return clean_string(data)
+    elif isinstance(data, dict):
+        cleaned = None
+        for i, (k, v) in enumerate(data.items()):
+            # Clean the key
+            clean_key = clean_string(k) if isinstance(k, str) else k
+            # Clean the value recursively
+            clean_value = clean_json_data(v)
+            if cleaned is None:
+                if clean_key is k and clean_value is v:
+                    continue
+                cleaned = dict(itertools.islice(data.items(), i))
+            cleaned[clean_key] = clean_value
+        return data if cleaned is None else cleaned
+    elif isinstance(data, list):
+        cleaned = None
+        for i, item in enumerate(data):
+            clean_item = clean_json_data(item)
+            if cleaned is None:
+                if clean_item is item:
+                    continue
+                cleaned = data[:i]
+            cleaned.append(clean_item)
+        return data if cleaned is None else cleaned
+    else:
+        return data
+
+
+def clean_string(text):
+    """Clean a string by removing or replacing problematic Unicode sequences"""
+    if not isinstance(text, str):
+        return text
+
+    # Most strings are clean; return them as-is without building a copy
+    if LINDI_PROBLEMATIC_RE.search(text) is None:
+        return text
+    return LINDI_PROBLEMATIC_RE.sub('', text)
+
+
+def save_lindi_metadata_batch(rows, sync_tracker=None, log: Optional[Callable[[str], Any]] = None) -> Tuple[int, int]:
+    """Upsert LINDI metadata for `(asset, lindi_url, filtered_data)` rows
+
+    Falls back to saving row by row if the bulk upsert fails, so one bad
+    document does not cost the whole batch. Progress and errors are passed
+    to `log` when given. Returns the number of rows saved and failed.
+    """
+    try:
+        with transaction.atomic():
+            LindiMetadata.objects.bulk_create(
+                [
+                    LindiMetadata(
+                        asset=asset,
+                        structure_metadata=filtered_data,  # Complete filtered structure including generationMetadata
+                        lindi_url=lindi_url,
+                        processing_version='1.0',
+                        sync_tracker=sync_tracker,
+                    )
+                    for asset, lindi_url, filtered_data in rows
+                ],
+                update_conflicts=True,
+                unique_fields=['asset'],
+                update_fields=LINDI_UPSERT_FIELDS,
+                batch_size=500,
+            )
+    except Exception as e:
+        if len(rows) > 1:
+            if log:
+                log(f"Error saving batch of {len(rows)} LINDI records, retrying individually: {e}")
+            saved = failed = 0
+            for row in rows:
+                row_saved, row_failed = save_lindi_metadata_batch([row], sync_tracker, log)
+                saved += row_saved
+                failed += row_failed
+            return saved, failed
+        if log:
+            log(f"Error saving LINDI metadata for {rows[0][0].dandi_asset_id}: {e}")
+        return 0, 1
+
+    if log:
+        for asset, _, _ in rows:
+            log(f"Processed LINDI metadata for: {asset.dandi_asset_id}")
+    return len(rows), 0
@@ -1,25 +1,43 @@
+import contextlib
+import functools
 import json
 import re
 import time
 import requests
-import tempfile
-import subprocess
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
 import hashlib
+import io
 import os
+import pickle
+from collections import defaultdict, deque
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List, Union, Tuple, Set, Callable, Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Union, Tuple, Set, Callable, Iterable, Iterator
 from django.core.management.base import BaseCommand, CommandParser
 from django.utils.dateparse import parse_datetime
-from django.utils import timezone as django_timezone
-from django.db import transaction, connections
+from django.db import models, transaction, connection
 from django.db.models import Q, QuerySet
 from tqdm import tqdm
 from dandi.dandiapi import DandiAPIClient
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import boto3
+from botocore import UNSIGNED
+from botocore.client import Config as BotoConfig
+from botocore.exceptions import BotoCoreError, ClientError
+from concurrent.futures import ThreadPoolExecutor
 import threading
 
+# Prefer the libyaml-backed loader; asset YAML files can be large
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+from dandisets.management.commands._lindi import (
+    clean_json_data, has_problematic_unicode, loads_json, save_lindi_metadata_batch,
+)
 from dandisets.models import (
     Dandiset, Contributor, SpeciesType, ApproachType, 
     MeasurementTechniqueType, StandardsType, AssetsSummary,
@@ -28,9 +46,271 @@ from dandisets.models import (
     DandisetAccessRequirements, DandisetRelatedResource,
     AssetsSummarySpecies, AssetsSummaryApproach, AssetsSummaryDataStandard,
     AssetsSummaryMeasurementTechnique, Affiliation, ContributorAffiliation,
-    Software, Asset, Participant, SexType, AssetDandiset, SyncTracker, LindiMetadata
+    Software, Asset, Participant, SexType, AssetDandiset, SyncTracker, LindiMetadata,
+    LindiNotFound,
+)
+
+
+# Progress bar postfix is only re-rendered every N iterations; for large asset
+# loops the per-item render otherwise costs more than the work itself.
+PROGRESS_POSTFIX_INTERVAL = 50
+# Minimum seconds between tqdm redraws
+PROGRESS_MININTERVAL = 0.5
+
+# Asset batches at least this large are written through COPY on PostgreSQL
+# even during incremental syncs; smaller ones use a bulk_create upsert
+COPY_LOAD_MIN_ROWS = 500
+
+# Default size of the shared worker pool; S3 and the DANDI API handle many
+# concurrent small GETs well, so this is mostly bounded by TLS overhead
+DEFAULT_MAX_WORKERS = 16
+
+# Public bucket holding the dandiset.yaml/assets.yaml exports
+DANDI_S3_BUCKET = 'dandiarchive'
+
+# YAML exports whose root is a long list; these are parsed and cached one
+# entry at a time and handed back as an iterator rather than a list
+STREAMED_YAML_FILES = frozenset({'assets.yaml'})
+
+# YAML cache keys used verbatim as file names; anything else is hashed
+CACHE_NAME_RE = re.compile(r'[\w.-]{1,200}', re.ASCII)
+
+# Dandisets never synced; they are dropped before any of their YAML is fetched
+SKIP_DANDISET_IDS = frozenset({'000026'})
+
+# Small vocabulary tables looked up by name and cached for the whole sync
+VOCABULARY_MODELS = (
+    SpeciesType, ApproachType, MeasurementTechniqueType, StandardsType,
+    SexType, Anatomy,
 )
 
+# Contributor identifier URLs, e.g. https://orcid.org/0000-0002-1825-0097
+# and https://ror.org/05dxps055
+ORCID_URL_RE = re.compile(r'orcid\.org/+(\d{4})-?(\d{4})-?(\d{4})-?(\d{3}[\dX])\b', re.IGNORECASE)
+ROR_URL_RE = re.compile(r'(?<![a-z])ror\.org/+([0-9a-z]+)', re.IGNORECASE)
+
+# OBO PURLs for anatomy/chemical terms, e.g.
+# http://purl.obolibrary.org/obo/UBERON_0000955
+OBO_PURL_RE = re.compile(r'http://purl\.obolibrary\.org/obo/(?P<ontology>UBERON|CHEBI)_(?P<term>\d+)')
+
+# Asset columns overwritten when an upserted asset already exists
+ASSET_UPSERT_FIELDS = [
+    'identifier', 'content_size', 'encoding_format', 'schema_version',
+    'date_modified', 'date_published', 'blob_date_modified', 'digest',
+    'content_url', 'variable_measured', 'updated_at',
+]
+
+# Returned by _download_lindi_file for a 404. Such assets are recorded in
+# LindiNotFound and not requested again until the recheck interval has passed
+LINDI_NOT_FOUND = object()
+LINDI_NOT_FOUND_RECHECK = timedelta(days=30)
+
+
+@dataclass
+class SyncStats:
+    """Running counters for a single sync run."""
+    dandisets_checked: int = 0
+    dandisets_updated: int = 0
+    dandisets_skipped: int = 0
+    dandisets_deleted: int = 0
+    assets_checked: int = 0
+    assets_updated: int = 0
+    assets_skipped: int = 0
+    assets_deleted: int = 0
+    lindi_processed: int = 0
+    lindi_skipped: int = 0
+    lindi_errors: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+def _parse_iso_datetime(value: Optional[Union[str, datetime]]) -> Optional[datetime]:
+    """
+    Parse an ISO-8601 timestamp into a timezone-aware datetime.
+
+    Accepts strings as well as datetime objects (PyYAML already converts
+    unquoted timestamps). Naive results are assumed to be UTC.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if not isinstance(value, str):
+        return None
+    return _parse_iso_string(value)
+
+
+def _copy_text_value(field, value) -> str:
+    """Encode a model field value for COPY ... FROM STDIN in text format."""
+    if isinstance(field, models.JSONField) and not (value is None and field.null):
+        value = json.dumps(value, cls=field.encoder)
+    elif value is None:
+        return '\\N'
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _asset_m2m_link(field_name: str) -> Tuple[Any, str, str]:
+    """Return ``(through model, asset attname, target attname)`` for an Asset
+    many-to-many field."""
+    field = Asset._meta.get_field(field_name)
+    return (
+        field.remote_field.through,
+        f"{field.m2m_field_name()}_id",
+        f"{field.m2m_reverse_field_name()}_id",
+    )
+
+
+def _compose_yaml_node(loader, anchors: Dict[str, Any]) -> Any:
+    """
+    Build the representation node for the next complete value in the event
+    stream, the way `yaml.composer.Composer.compose_node` does.
+
+    The C loader does not expose its composer per node, so this lets
+    `_iter_yaml_sequence` compose one list entry at a time.
+    """
+    event = loader.get_event()
+    if isinstance(event, yaml.AliasEvent):
+        return anchors[event.anchor]
+    if isinstance(event, yaml.ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+        if event.anchor:
+            anchors[event.anchor] = node
+        return node
+    
+    is_sequence = isinstance(event, yaml.SequenceStartEvent)
+    node_class = yaml.SequenceNode if is_sequence else yaml.MappingNode
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = loader.resolve(node_class, None, event.implicit)
+    node = node_class(tag, [], event.start_mark, None, flow_style=event.flow_style)
+    if event.anchor:
+        anchors[event.anchor] = node
+    if is_sequence:
+        while not loader.check_event(yaml.SequenceEndEvent):
+            node.value.append(_compose_yaml_node(loader, anchors))
+    else:
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = _compose_yaml_node(loader, anchors)
+            node.value.append((key, _compose_yaml_node(loader, anchors)))
+    node.end_mark = loader.get_event().end_mark
+    return node
+
+
+def _iter_yaml_sequence(source: Union[bytes, str]):
+    """
+    Yield the entries of a YAML document whose root is a list, one at a time.
+
+    Only the entry being constructed is held as Python objects, instead of
+    the whole list as with ``yaml.load``. An empty or null document yields
+    nothing; any other non-list root raises ValueError.
+    """
+    loader = YamlLoader(source)
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStartEvent
+        anchors = {}
+        if not loader.check_event(yaml.SequenceStartEvent):
+            root = loader.construct_document(_compose_yaml_node(loader, anchors))
+            if root is None:
+                return
+            raise ValueError(f"expected a list at the document root, got {type(root).__name__}")
+        loader.get_event()  # SequenceStartEvent
+        while not loader.check_event(yaml.SequenceEndEvent):
+            yield loader.construct_document(_compose_yaml_node(loader, anchors))
+    finally:
+        loader.dispose()
+
+
+@contextlib.contextmanager
+def _atomic_write(path: Path, mode: str = 'wb'):
+    """
+    Open a sibling temporary file for writing and move it over `path` once
+    the block completes, so a reader never sees a partially written file.
+
+    The temporary name is unique per process and thread, so concurrent
+    writers of the same cache entry cannot interleave; the last
+    ``os.replace`` wins with a complete file.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Replace the contents of a small text file atomically."""
+    with _atomic_write(path, 'w') as f:
+        f.write(text)
+
+
+def _iter_pickle_stream(f):
+    """Yield consecutive pickled records from an open binary file, then close it."""
+    with f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _latest_epoch_micros(*values: Optional[datetime]) -> Optional[int]:
+    """
+    Return the latest of the given aware datetimes as integer microseconds
+    since the epoch, or None if all are missing.
+
+    Change detection compares these ints rather than datetime objects.
+    """
+    stamps = [(value - _EPOCH) // _MICROSECOND for value in values if value]
+    return max(stamps) if stamps else None
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_iso_string(value: str) -> Optional[datetime]:
+    """
+    Memoized string parser behind `_parse_iso_datetime`.
+
+    DANDI timestamps repeat heavily within a sync (shared publish and
+    modification dates), so results are cached per run. Uses the
+    C-implemented ``datetime.fromisoformat`` and only falls back to Django's
+    regex-based ``parse_datetime`` for strings it rejects.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            # Well-formed but out-of-range values, e.g. month 13
+            parsed = None
+        if parsed is None:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
 
 class Command(BaseCommand):
     """
@@ -59,25 +339,26 @@ class Command(BaseCommand):
         """
         super().__init__(*args, **kwargs)
         self.client = DandiAPIClient()
-        self.stats = {
-            'dandisets_checked': 0,
-            'dandisets_updated': 0,
-            'dandisets_skipped': 0,
-            'dandisets_deleted': 0,
-            'assets_checked': 0,
-            'assets_updated': 0,
-            'assets_skipped': 0,
-            'assets_deleted': 0,
-            'lindi_processed': 0,
-            'lindi_skipped': 0,
-            'lindi_errors': 0,
-            'errors': 0,
-            'cache_hits': 0,
-            'cache_misses': 0,
-        }
+        self.stats = SyncStats()
         self.dry_run = False
         self.verbose = False
+        self.batch_size = 1000
+        self.max_workers = DEFAULT_MAX_WORKERS
+        self.copy_load = False
+        # Worker pool shared by every phase for network I/O only (REST asset
+        # metadata, YAML downloads, LINDI files); None with --disable-parallel
+        self.pool = None
+        self._fetching_batch = None
+        # Raw metadata that _asset_needs_update fetched for assets it found
+        # changed, keyed by asset identifier; _update_assets consumes it
+        # instead of requesting the same metadata again
+        self._raw_metadata_cache = {}
+        # In-flight get_raw_metadata() calls started by _prefetch_raw_metadata
+        self._raw_metadata_futures = {}
         self.session = requests.Session()
+        # requests already sends Accept-Encoding: gzip, deflate (plus br when
+        # brotli is installed) and decodes transparently; LINDI JSON is very
+        # repetitive, so compressed transfers are several times smaller.
         # Set a reasonable timeout and user agent for LINDI requests
         self.session.headers.update({
             'User-Agent': 'dandi-sql-unified-sync/1.0'
@@ -85,107 +366,249 @@ class Command(BaseCommand):
         # Cache for API dandisets to avoid multiple expensive API calls
         self._api_dandisets_cache = None
         self._api_dandisets_dict_cache = None
+        self._api_dandiset_index = None
+        # In-memory caches of the small vocabulary tables (SpeciesType,
+        # ApproachType, ...) keyed by model then by name
+        self._type_caches = {}
+        # Contributor lookups (by identifier, email, name), loaded on first use
+        self._contributor_caches = None
+        # Affiliation pks keyed by name, loaded on first use, and the
+        # (contributor_pk, affiliation data) links waiting for _flush_affiliations
+        self._affiliation_cache = None
+        self._pending_affiliations = []
+        # AccessRequirements keyed by status and ContactPoint keyed by email
+        self._access_requirements_cache = {}
+        self._contact_point_cache = {}
+        # Activity and Software rows keyed by name, Participant by identifier
+        self._activity_cache = {}
+        self._software_cache = {}
+        self._participant_cache = {}
+        # Pending through-table rows keyed by through model, written in bulk
+        self._m2m_buffers = defaultdict(list)
         
         # Set up YAML file caching
         self.cache_dir = Path.home() / '.cache' / 'dandi-sql' / 'yaml-cache'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_ttl = 3600  # Cache TTL in seconds (1 hour)
+        self._s3_client = None
+        # Background YAML downloads keyed by (normalized dandiset id, filename)
+        self._yaml_prefetches = {}
+        self._stats_lock = threading.Lock()
 
-    def download_yaml_from_s3(self, dandiset_id: str, filename: str) -> Optional[Dict[str, Any]]:
+    def download_yaml_from_s3(self, dandiset_id: str, filename: str) -> Optional[Union[Dict[str, Any], Iterator[Any]]]:
         """
-        Download YAML file from S3 using AWS CLI with caching support.
+        Download YAML file from S3 using boto3 with caching support.
         
-        This method downloads YAML files from the DANDI S3 bucket using the AWS CLI.
-        It implements a local file cache with TTL to avoid repeated downloads of the
-        same files within the cache window.
+        This method downloads YAML files from the DANDI S3 bucket with an
+        unsigned (anonymous) boto3 client.
+        It keeps a local file cache that is revalidated against the S3 ETag, so
+        unchanged files are not downloaded again and changed ones never go stale.
         
         Args:
             dandiset_id: The DANDI dataset identifier (e.g., "000003" or "DANDI:000003")
             filename: The YAML filename to download (e.g., "dandiset.yaml", "assets.yaml")
             
         Returns:
-            Dictionary containing the parsed YAML content, or None if download/parsing failed
+            Dictionary containing the parsed YAML content, or None if download/parsing failed.
+            Files in STREAMED_YAML_FILES (e.g. assets.yaml) are returned as an
+            iterator over the list entries instead, read lazily from the cache.
             
         Note:
-            Uses MD5 hash of the cache key for filename to avoid filesystem issues.
-            Automatically handles cache expiration based on self.cache_ttl.
+            Cache files are named after the dandiset and file, e.g.
+            ``000003_assets.yaml.pkls``; a BLAKE2 hash is only used for ids that
+            are not safe as a filename.
+            The cache stores the parsed content as a pickle, so hits skip YAML
+            parsing entirely; the cache directory is local to this machine.
+            If `_prefetch_dandiset_yaml` already started this download in the
+            background, its result is returned instead.
         """
         # Normalize dandiset ID (remove DANDI: prefix and ensure 6 digits)
         normalized_id = self._normalize_dandiset_id(dandiset_id)
         
-        # Generate cache key
+        prefetch = self._yaml_prefetches.pop((normalized_id, filename), None)
+        if prefetch is not None:
+            return prefetch.result()
+        return self._download_yaml_from_s3(normalized_id, filename)
+
+    def _download_yaml_from_s3(self, normalized_id: str, filename: str) -> Optional[Union[Dict[str, Any], Iterator[Any]]]:
+        """Download and cache one YAML file; safe to call from worker threads"""
+        stream = filename in STREAMED_YAML_FILES
+        # Generate cache key; normalized ids are already filesystem-safe
         cache_key = f"{normalized_id}_{filename}"
-        cache_hash = hashlib.md5(cache_key.encode()).hexdigest()
-        cache_file = self.cache_dir / f"{cache_hash}.yaml"
+        if not CACHE_NAME_RE.fullmatch(cache_key):
+            cache_key = hashlib.blake2b(cache_key.encode(), digest_size=16).hexdigest()
+        # Streamed files are cached as one pickle record per list entry
+        cache_file = self.cache_dir / f"{cache_key}.{'pkls' if stream else 'pkl'}"
+        etag_file = self.cache_dir / f"{cache_key}.etag"
+        content_hash_file = self.cache_dir / f"{cache_key}.b2"
+        s3_key = f"dandisets/{normalized_id}/draft/{filename}"
+        
+        # Revalidate a cached copy with a conditional GET: S3 answers
+        # 304 Not Modified, without a body, while the ETag is unchanged
+        cached_etag = None
+        if cache_file.exists() and etag_file.exists():
+            try:
+                cached_etag = etag_file.read_text().strip() or None
+            except OSError:
+                cached_etag = None
+        request = {'Bucket': DANDI_S3_BUCKET, 'Key': s3_key}
+        if cached_etag:
+            request['IfNoneMatch'] = cached_etag
         
-        # Check if cached file exists and is not expired
-        if cache_file.exists():
+        try:
+            response = self._get_s3_client().get_object(**request)
+        except ClientError as e:
+            not_modified = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 304
+            if not (cached_etag and not_modified):
+                if self.verbose:
+                    self.stdout.write(f"Failed to download {filename} for dandiset {normalized_id}: {e}")
+                return None
+            
+            # Unchanged on S3 - load from cache
             try:
-                file_age = time.time() - cache_file.stat().st_mtime
-                if file_age < self.cache_ttl:
-                    # Load from cache
-                    with open(cache_file, 'r') as f:
-                        yaml_content = yaml.safe_load(f)
-                    
-                    self.stats['cache_hits'] += 1
-                    if self.verbose:
-                        self.stdout.write(f"Loaded {filename} for dandiset {normalized_id} from cache")
-                    return yaml_content
-                else:
-                    # Cache expired, remove old file
-                    cache_file.unlink()
-                    if self.verbose:
-                        self.stdout.write(f"Cache expired for {filename} for dandiset {normalized_id}")
+                yaml_content = self._read_yaml_cache(cache_file, stream)
             except Exception as e:
                 if self.verbose:
                     self.stdout.write(f"Error reading cache for {filename}: {e}")
-                # Remove corrupted cache file
+                # Remove corrupted cache entry and download it again
                 cache_file.unlink(missing_ok=True)
+                etag_file.unlink(missing_ok=True)
+                return self._download_yaml_from_s3(normalized_id, filename)
+            
+            with self._stats_lock:
+                self.stats.cache_hits += 1
+            if self.verbose:
+                self.stdout.write(f"Loaded {filename} for dandiset {normalized_id} from cache")
+            return yaml_content
+        except BotoCoreError as e:
+            if self.verbose:
+                self.stdout.write(f"Failed to download {filename} for dandiset {normalized_id}: {e}")
+            return None
         
-        # Download from S3
-        s3_url = f"s3://dandiarchive/dandisets/{normalized_id}/draft/{filename}"
-        self.stats['cache_misses'] += 1
+        with self._stats_lock:
+            self.stats.cache_misses += 1
         
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.yaml', delete=False) as temp_file:
-            try:
-                # Use AWS CLI to download the file
-                result = subprocess.run([
-                    'aws', 's3', 'cp', 
-                    '--no-sign-request',
-                    s3_url,
-                    temp_file.name
-                ], capture_output=True, text=True, check=True)
-                
-                # Read and parse the YAML content
-                with open(temp_file.name, 'r') as f:
-                    yaml_content = yaml.safe_load(f)
-                
-                # Save to cache
-                try:
-                    with open(cache_file, 'w') as f:
-                        yaml.dump(yaml_content, f)
-                    if self.verbose:
-                        self.stdout.write(f"Cached {filename} for dandiset {normalized_id}")
-                except Exception as e:
-                    if self.verbose:
-                        self.stdout.write(f"Failed to cache {filename}: {e}")
-                
+        try:
+            raw = response['Body'].read()
+        except BotoCoreError as e:
+            if self.verbose:
+                self.stdout.write(f"Failed to download {filename} for dandiset {normalized_id}: {e}")
+            return None
+        
+        # A new ETag does not always mean new bytes (e.g. a re-upload of the
+        # same export); reuse the cached parse when the content hash matches
+        content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        try:
+            if cache_file.exists() and content_hash_file.read_text().strip() == content_hash:
+                yaml_content = self._read_yaml_cache(cache_file, stream)
+                _write_text_atomic(etag_file, response.get('ETag', ''))
                 if self.verbose:
-                    self.stdout.write(f"Successfully downloaded {filename} for dandiset {normalized_id}")
-                
+                    self.stdout.write(f"Downloaded {filename} for dandiset {normalized_id} is unchanged, reusing cache")
                 return yaml_content
-                
-            except subprocess.CalledProcessError as e:
-                if self.verbose:
-                    self.stdout.write(f"Failed to download {filename} for dandiset {normalized_id}: {e.stderr}")
-                return None
-            except yaml.YAMLError as e:
-                if self.verbose:
-                    self.stdout.write(f"Failed to parse YAML content from {filename} for dandiset {normalized_id}: {e}")
-                return None
-            finally:
-                # Clean up temp file
-                Path(temp_file.name).unlink(missing_ok=True)
+        except Exception:
+            pass  # Fall through to parsing the download
+        
+        if stream:
+            return self._cache_yaml_stream(
+                raw, cache_file, etag_file, content_hash_file,
+                response.get('ETag', ''), content_hash, normalized_id, filename
+            )
+        
+        try:
+            yaml_content = yaml.load(raw, Loader=YamlLoader)
+        except yaml.YAMLError as e:
+            if self.verbose:
+                self.stdout.write(f"Failed to parse YAML content from {filename} for dandiset {normalized_id}: {e}")
+            return None
+        
+        # Save to cache, along with the ETag used to revalidate it and the
+        # hash of the raw content
+        try:
+            with _atomic_write(cache_file) as f:
+                pickle.dump(yaml_content, f, protocol=pickle.HIGHEST_PROTOCOL)
+            _write_text_atomic(etag_file, response.get('ETag', ''))
+            _write_text_atomic(content_hash_file, content_hash)
+            if self.verbose:
+                self.stdout.write(f"Cached {filename} for dandiset {normalized_id}")
+        except Exception as e:
+            etag_file.unlink(missing_ok=True)
+            content_hash_file.unlink(missing_ok=True)
+            if self.verbose:
+                self.stdout.write(f"Failed to cache {filename}: {e}")
+        
+        if self.verbose:
+            self.stdout.write(f"Successfully downloaded {filename} for dandiset {normalized_id}")
+        
+        return yaml_content
+
+    def _read_yaml_cache(self, cache_file: Path, stream: bool) -> Union[Any, Iterator[Any]]:
+        """Load a cached parse, lazily for streamed files"""
+        if stream:
+            return _iter_pickle_stream(open(cache_file, 'rb'))
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+
+    def _cache_yaml_stream(
+        self,
+        raw: bytes,
+        cache_file: Path,
+        etag_file: Path,
+        content_hash_file: Path,
+        etag: str,
+        content_hash: str,
+        normalized_id: str,
+        filename: str
+    ) -> Optional[Iterator[Any]]:
+        """
+        Parse a list-rooted YAML file entry by entry straight into the cache.
+
+        Each entry is pickled as soon as it is constructed, so the full list
+        is never held in memory; the caller then reads the entries back one
+        at a time from the cache file. The cache is written atomically, so a
+        failed parse never leaves a partial entry behind.
+        """
+        try:
+            with _atomic_write(cache_file) as f:
+                for entry in _iter_yaml_sequence(raw):
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except yaml.YAMLError as e:
+            if self.verbose:
+                self.stdout.write(f"Failed to parse YAML content from {filename} for dandiset {normalized_id}: {e}")
+            return None
+        
+        try:
+            _write_text_atomic(etag_file, etag)
+            _write_text_atomic(content_hash_file, content_hash)
+            if self.verbose:
+                self.stdout.write(f"Cached {filename} for dandiset {normalized_id}")
+        except Exception as e:
+            etag_file.unlink(missing_ok=True)
+            content_hash_file.unlink(missing_ok=True)
+            if self.verbose:
+                self.stdout.write(f"Failed to cache {filename}: {e}")
+        
+        if self.verbose:
+            self.stdout.write(f"Successfully downloaded {filename} for dandiset {normalized_id}")
+        
+        return _iter_pickle_stream(open(cache_file, 'rb'))
+
+    def _get_s3_client(self):
+        """
+        Return the anonymous S3 client used for YAML downloads, creating it on first use.
+
+        A single client is shared for the whole sync so HTTPS connections to S3
+        are pooled and reused instead of paying process start-up and a TLS
+        handshake per file.
+        """
+        if self._s3_client is None:
+            self._s3_client = boto3.client(
+                's3',
+                config=BotoConfig(
+                    signature_version=UNSIGNED,
+                    max_pool_connections=max(20, self.max_workers * 2),
+                    retries={'max_attempts': 3},
+                ),
+            )
+        return self._s3_client
 
     def normalize_uberon_identifier(self, identifier: Optional[str]) -> Optional[str]:
         """
@@ -213,46 +636,13 @@ class Command(BaseCommand):
             return identifier
             
         # Convert http://purl.obolibrary.org/obo/UBERON_XXXXXXX to UBERON:XXXXXXX
-        match = re.match(r'http://purl\.obolibrary\.org/obo/UBERON_(\d+)', identifier)
+        # (and the same for CHEBI)
+        match = OBO_PURL_RE.match(identifier)
         if match:
-            return f"UBERON:{match.group(1)}"
-            
-        # Convert http://purl.obolibrary.org/obo/CHEBI_XXXXXXX to CHEBI:XXXXXXX
-        match = re.match(r'http://purl\.obolibrary\.org/obo/CHEBI_(\d+)', identifier)
-        if match:
-            return f"CHEBI:{match.group(1)}"
+            return f"{match.group('ontology')}:{match.group('term')}"
             
         return identifier
 
-    def _parse_datetime_with_timezone(self, datetime_str: Optional[str]) -> Optional[datetime]:
-        """
-        Parse datetime string and ensure it's timezone-aware.
-        
-        Converts naive datetime objects to timezone-aware ones by assuming UTC
-        if no timezone information is present.
-        
-        Args:
-            datetime_str: ISO format datetime string or None
-            
-        Returns:
-            Timezone-aware datetime object or None if parsing fails
-            
-        Note:
-            Uses Django's timezone utilities to handle timezone conversion safely.
-        """
-        if not datetime_str:
-            return None
-        
-        parsed_dt = parse_datetime(datetime_str)
-        if not parsed_dt:
-            return None
-        
-        # If the datetime is naive (no timezone info), assume UTC
-        if django_timezone.is_naive(parsed_dt):
-            parsed_dt = django_timezone.make_aware(parsed_dt, timezone.utc)
-        
-        return parsed_dt
-
     def _normalize_dandiset_id(self, dandiset_id: Optional[str]) -> Optional[str]:
         """Normalize dandiset ID to standard 6-digit format"""
         if not dandiset_id:
@@ -265,6 +655,138 @@ class Command(BaseCommand):
         # Pad with zeros if needed (e.g., 3 -> 000003)
         return dandiset_id.zfill(6)
 
+    def _get_local_dandiset(self, dandiset_id: str) -> Optional['Dandiset']:
+        """
+        Return the local version of a dandiset that its assets are attached to.
+
+        Looks up the exact (indexed) ``DANDI:<id>`` base_id and prefers the
+        draft, then the latest version, since every version shares a base_id.
+        Only the columns the asset sync reads are loaded; its assets summary
+        comes along in the same query.
+        """
+        base_id = f"DANDI:{self._normalize_dandiset_id(dandiset_id)}"
+        return (
+            Dandiset.objects.filter(base_id=base_id)
+            .select_related('assets_summary')
+            .only('id', 'base_id', 'assets_summary')
+            .order_by('-is_draft', '-is_latest', '-pk')
+            .first()
+        )
+
+    def _get_or_create_type(self, model: Any, name: str, defaults: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Get or create a vocabulary row (SpeciesType, ApproachType, ...) by name.
+
+        The first lookup for a model loads the whole table into memory; later
+        lookups are served from the cache and only a genuine miss touches the
+        database. This replaces one SELECT per related row with one SELECT per
+        table per sync.
+
+        Parameters
+        ----------
+        model : type
+            Vocabulary model class with a ``name`` field
+        name : str
+            Name to look up
+        defaults : Optional[Dict[str, Any]], default=None
+            Extra field values used when a new row has to be created
+
+        Returns
+        -------
+        Model instance
+            Existing or newly created row
+        """
+        cache = self._get_or_create_type_cache(model)
+        obj = cache.get(name)
+        if obj is None:
+            obj = model.objects.create(name=name, **(defaults or {}))
+            cache[name] = obj
+        return obj
+
+    def _warm_type_caches(self) -> None:
+        """
+        Load every vocabulary table into memory up front.
+
+        These tables hold a few dozen rows each and are reused by nearly every
+        dandiset and asset, so one SELECT per table at sync start replaces the
+        first lookup of each name that would otherwise hit the database. The
+        other small lookup tables keyed by a single column (Activity and
+        Software by name, AccessRequirements by status, ContactPoint by email)
+        are loaded the same way.
+        """
+        for model in VOCABULARY_MODELS:
+            if model not in self._type_caches:
+                self._get_or_create_type_cache(model)
+        
+        # Iterate newest-first so the oldest row wins on duplicate keys
+        lookup_caches = (
+            (self._activity_cache, Activity, 'name'),
+            (self._software_cache, Software, 'name'),
+            (self._access_requirements_cache, AccessRequirements, 'status'),
+            (self._contact_point_cache, ContactPoint, 'email'),
+        )
+        for cache, model, key in lookup_caches:
+            if not cache:
+                cache.update((getattr(obj, key), obj) for obj in model.objects.order_by('-pk'))
+
+    def _get_or_create_type_cache(self, model: Any) -> Dict[str, Any]:
+        """Return the name -> row cache for a vocabulary model, loading it on first use"""
+        cache = self._type_caches.get(model)
+        if cache is None:
+            # Iterate newest-first so the oldest row wins on duplicate names,
+            # matching what get_or_create would have picked up first
+            cache = {obj.name: obj for obj in model.objects.order_by('-pk')}
+            self._type_caches[model] = cache
+        return cache
+
+    def _get_contributor_caches(self) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Return in-memory contributor lookups ``(by_identifier, by_email, by_name)``.
+
+        Contributors repeat heavily across dandisets (the same PIs and labs),
+        so the table is loaded once and `_load_contributor` only queries the
+        database to create genuinely new contributors.
+        """
+        if self._contributor_caches is None:
+            by_identifier, by_email, by_name = {}, {}, {}
+            # Iterate newest-first so the oldest row wins on duplicates,
+            # matching the previous filter(...).first() lookups
+            for contributor in Contributor.objects.order_by('-pk'):
+                if contributor.identifier:
+                    by_identifier[contributor.identifier] = contributor
+                if contributor.email:
+                    by_email[contributor.email] = contributor
+                by_name[contributor.name] = contributor
+            self._contributor_caches = (by_identifier, by_email, by_name)
+        return self._contributor_caches
+
+    def _cache_contributor(self, contributor: 'Contributor') -> None:
+        """Register a created or updated contributor in the lookup caches"""
+        by_identifier, by_email, by_name = self._get_contributor_caches()
+        if contributor.identifier:
+            by_identifier.setdefault(contributor.identifier, contributor)
+        if contributor.email:
+            by_email.setdefault(contributor.email, contributor)
+        by_name.setdefault(contributor.name, contributor)
+
+    def _invalidate_lookup_caches(self) -> None:
+        """
+        Drop the vocabulary, contributor, affiliation and access requirement
+        caches, along with affiliation links queued inside the transaction.
+
+        Called after a transaction is rolled back, since rows created inside
+        it would otherwise stay cached even though they no longer exist.
+        """
+        self._type_caches.clear()
+        self._contributor_caches = None
+        self._affiliation_cache = None
+        self._pending_affiliations.clear()
+        self._access_requirements_cache.clear()
+        self._contact_point_cache.clear()
+        self._activity_cache.clear()
+        self._software_cache.clear()
+        self._participant_cache.clear()
+
     def _get_api_dandisets(self) -> List[Any]:
         """Get all dandisets from API with caching to avoid multiple expensive calls"""
         if self._api_dandisets_cache is None:
@@ -280,6 +802,16 @@ class Command(BaseCommand):
             self._api_dandisets_dict_cache = {ds.identifier: ds for ds in api_dandisets}
         return self._api_dandisets_dict_cache
 
+    def _get_api_dandiset_index(self) -> Dict[str, Any]:
+        """Index the cached API dandisets by bare number, ``DANDI:<number>`` and identifier"""
+        if self._api_dandiset_index is None:
+            index = {}
+            for ds in self._get_api_dandisets():
+                number = ds.identifier.split(':')[-1]
+                index[number] = index[f"DANDI:{number}"] = index[ds.identifier] = ds
+            self._api_dandiset_index = index
+        return self._api_dandiset_index
+
     def _process_with_progress(
         self, 
         items: Iterable[Any], 
@@ -287,7 +819,9 @@ class Command(BaseCommand):
         description: str, 
         unit: str = "item", 
         postfix_func: Optional[Callable[[Any], Dict[str, Any]]] = None, 
-        leave: bool = True
+        leave: bool = True,
+        postfix_interval: int = PROGRESS_POSTFIX_INTERVAL,
+        total: Optional[int] = None
     ) -> None:
         """
         Generic function to process items with optional progress bar support.
@@ -313,6 +847,13 @@ class Command(BaseCommand):
             item information during processing.
         leave : bool, default=True
             Whether to leave progress bar visible after completion
+        postfix_interval : int, default=PROGRESS_POSTFIX_INTERVAL
+            Only call `postfix_func` and re-render the postfix every this many
+            items. Rendering the postfix on every item dominates CPU time in
+            loops where most items are no-ops.
+        total : Optional[int], default=None
+            Number of items, for progress bars over iterators that have no
+            ``len()`` (e.g. ``QuerySet.iterator()``)
             
         Returns
         -------
@@ -325,7 +866,8 @@ class Command(BaseCommand):
         - When `no_progress=True`: Items are processed sequentially without 
           any visual progress indication
         - When `no_progress=False`: Uses tqdm to display a progress bar with
-          optional postfix updates showing current item information
+          optional postfix updates showing current item information, refreshed
+          every `postfix_interval` items
           
         Examples
         --------
@@ -342,82 +884,62 @@ class Command(BaseCommand):
             for item in items:
                 process_func(item)
         else:
-            with tqdm(items, desc=description, unit=unit, leave=leave) as pbar:
-                for item in pbar:
-                    if postfix_func:
-                        pbar.set_postfix(**postfix_func(item))
+            with tqdm(items, desc=description, unit=unit, leave=leave, total=total,
+                      mininterval=PROGRESS_MININTERVAL) as pbar:
+                for i, item in enumerate(pbar):
+                    if postfix_func and i % postfix_interval == 0:
+                        pbar.set_postfix(**postfix_func(item), refresh=False)
                     process_func(item)
 
-    def _truncate_path(self, path: Optional[str], max_length: int = 30) -> str:
+    def _lindi_asset_ids(self, assets: Union[QuerySet, Iterable['Asset']]) -> Set[int]:
         """
-        Truncate a file path for display purposes.
+        Return the pks of the given assets that already have LINDI metadata.
 
         Parameters
         ----------
-        path : Optional[str]
-            File path to truncate, may be None
-        max_length : int, default=30
-            Maximum allowed length before truncation
+        assets : QuerySet or iterable of Asset
+            Assets to check; a queryset is used as a subquery
 
         Returns
         -------
-        str
-            Truncated path string with ellipsis if needed, or 'unknown' if path is None
-
-        Examples
-        --------
-        >>> cmd._truncate_path("/very/long/path/to/file.txt")
-        "/very/long/path/to/file..."
-        >>> cmd._truncate_path(None)
-        "unknown"
+        Set[int]
+            Asset pks with a LindiMetadata row, fetched with one query so
+            callers can test membership instead of querying per asset
         """
-        if not path:
-            return 'unknown'
-        return path[:max_length] + '...' if len(path) > max_length else path
+        if not isinstance(assets, QuerySet):
+            assets = [asset.pk for asset in assets]
+        return set(
+            LindiMetadata.objects.filter(asset__in=assets).values_list('asset_id', flat=True)
+        )
 
-    def _asset_has_lindi_metadata(self, asset: 'Asset') -> bool:
+    def _lindi_base_ids(self, assets: Iterable['Asset']) -> Dict[int, str]:
         """
-        Check if an asset already has LINDI metadata in the database.
+        Return the dandiset base_id used in each asset's LINDI URL.
 
         Parameters
         ----------
-        asset : Asset
-            Asset model instance to check for existing LINDI metadata
+        assets : iterable of Asset
+            Assets whose LINDI URLs are about to be built
 
         Returns
         -------
-        bool
-            True if the asset has LINDI metadata, False otherwise
-
-        Notes
-        -----
-        Uses a try/except pattern to handle the DoesNotExist case efficiently
-        rather than checking existence first then querying.
-        """
-        try:
-            LindiMetadata.objects.get(asset=asset)
-            return True
-        except LindiMetadata.DoesNotExist:
-            return False
-
-    def _should_process_lindi_for_asset(self, asset, force_refresh=False):
-        """Determine if an asset should have its LINDI metadata processed
-        
-        Args:
-            asset: The asset to check
-            force_refresh: If True, always process regardless of existing metadata
-            
-        Returns:
-            bool: True if asset should be processed, False otherwise
+        Dict[int, str]
+            Asset pk to base_id, fetched in one query per batch instead of one
+            per asset. Like ``asset.dandisets.first()``, an asset linked to
+            several dandisets maps to the lowest base_id. Assets without a
+            dandiset are missing from the mapping.
         """
-        if force_refresh:
-            return True
-        
-        try:
-            LindiMetadata.objects.get(asset=asset)
-            return False  # Asset already has LINDI metadata
-        except LindiMetadata.DoesNotExist:
-            return True  # Asset needs LINDI metadata
+        asset_pks = [asset.pk for asset in assets]
+        base_ids = {}
+        for i in range(0, len(asset_pks), self.batch_size):
+            links = (
+                AssetDandiset.objects.filter(asset_id__in=asset_pks[i:i + self.batch_size])
+                .order_by('dandiset__base_id')
+                .values_list('asset_id', 'dandiset__base_id')
+            )
+            for asset_pk, base_id in links:
+                base_ids.setdefault(asset_pk, base_id)
+        return base_ids
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -485,7 +1007,7 @@ class Command(BaseCommand):
         parser.add_argument(
             '--force-lindi-refresh',
             action='store_true',
-            help='Force refresh of LINDI metadata even if it already exists',
+            help='Force refresh of LINDI metadata even if it already exists, and retry assets whose LINDI file was recently not found',
         )
         parser.add_argument(
             '--dandiset-filter',
@@ -495,14 +1017,30 @@ class Command(BaseCommand):
         parser.add_argument(
             '--max-workers',
             type=int,
-            default=4,
-            help='Maximum number of parallel workers for I/O operations (default: 4)',
+            default=DEFAULT_MAX_WORKERS,
+            help=(
+                f'Maximum number of parallel workers for I/O operations such as S3 YAML '
+                f'and metadata downloads (default: {DEFAULT_MAX_WORKERS}); returns diminish '
+                f'beyond ~50 because of per-connection TLS overhead'
+            ),
         )
         parser.add_argument(
             '--disable-parallel',
             action='store_true',
             help='Disable parallel processing (use single-threaded mode)',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of changed assets written per bulk upsert and transaction (default: 1000)',
+        )
+        parser.add_argument(
+            '--commit-interval',
+            type=int,
+            default=1000,
+            help='Write running counters to the sync tracker every N checked assets (default: 1000, 0 disables)',
+        )
         parser.add_argument(
             '--skip-deletions',
             action='store_true',
@@ -515,8 +1053,36 @@ class Command(BaseCommand):
         self.no_progress = options['no_progress']
         self.options = options  # Store options for later use
         self.timeout = options.get('timeout', 30)
+        self.commit_interval = options.get('commit_interval') or 0
+        self.batch_size = max(1, options.get('batch_size') or 1000)
+        self.sync_tracker = None
+        # assets_checked at the last tracker checkpoint
+        self._last_checkpoint = 0
+        self.max_workers = max(1, options.get('max_workers') or DEFAULT_MAX_WORKERS)
+        if not options.get('disable_parallel'):
+            self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='dandi-sync')
+        # Worker threads share these sessions; size their pools so pooled
+        # connections are reused rather than discarded under concurrency.
+        # LINDI downloads also retry transient failures with backoff; the
+        # DANDI client already retries its own requests, so its session
+        # only gets the larger pool
+        pool_size = max(10, self.max_workers * 2)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET'],
+            ),
+        ))
+        self.client.session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
         
         start_time = time.time()
+        # Recorded as the tracker's last_sync_timestamp so changes made on
+        # the server while this sync runs are picked up by the next one
+        self.sync_started_at = datetime.now(timezone.utc)
         sync_tracker = None
         
         try:
@@ -533,6 +1099,9 @@ class Command(BaseCommand):
             else:
                 self.stdout.write("No previous sync found - performing full sync")
             
+            # Full loads are almost all inserts; stream asset rows with COPY
+            self.copy_load = last_sync_time is None and connection.vendor == 'postgresql'
+            
             if self.dry_run:
                 self.stdout.write(self.style.WARNING("DRY RUN MODE - No changes will be made"))
             else:
@@ -540,13 +1109,18 @@ class Command(BaseCommand):
                 sync_tracker = SyncTracker.objects.create(
                     sync_type=sync_scope,
                     status='running',
-                    last_sync_timestamp=datetime.now(timezone.utc),
+                    last_sync_timestamp=self.sync_started_at,
                     dandisets_synced=0,
                     assets_synced=0,
                     dandisets_updated=0,
                     assets_updated=0,
                     sync_duration_seconds=0.0
                 )
+                self.sync_tracker = sync_tracker
+            
+            # Load vocabulary tables once; LINDI-only syncs never touch them
+            if not options.get('lindi_only'):
+                self._warm_type_caches()
             
             # Check if this is a LINDI-only sync
             if options.get('lindi_only'):
@@ -555,6 +1129,7 @@ class Command(BaseCommand):
             else:
                 # Perform unified sync - iterate through dandisets and handle both metadata and assets
                 self._sync_dandisets_and_assets(last_sync_time, options, sync_scope, sync_tracker)
+                self._flush_fetched_assets()
                 
                 # Check for deleted dandisets unless skipped or processing specific dandiset
                 if not options.get('skip_deletions', False) and not options.get('dandiset_id'):
@@ -584,6 +1159,13 @@ class Command(BaseCommand):
                 import traceback
                 self.stdout.write(traceback.format_exc())
             raise
+        finally:
+            self._fetching_batch = None
+            self._raw_metadata_cache.clear()
+            self._raw_metadata_futures.clear()
+            if self.pool is not None:
+                self.pool.shutdown(cancel_futures=True)
+                self.pool = None
 
     def _determine_sync_scope(self, options):
         """Determine what to sync based on options"""
@@ -600,16 +1182,13 @@ class Command(BaseCommand):
             return None
         
         if options['since']:
-            # Parse user-provided date
-            try:
-                return parse_datetime(options['since'])
-            except:
-                try:
-                    # Try parsing as date only
-                    date_only = datetime.strptime(options['since'], '%Y-%m-%d')
-                    return date_only.replace(tzinfo=timezone.utc)
-                except:
-                    raise ValueError(f"Invalid date format: {options['since']}")
+            # Parse user-provided date once into a UTC-aware datetime so the
+            # per-item comparisons never need to re-parse or re-localize it.
+            # fromisoformat also accepts date-only YYYY-MM-DD strings.
+            since = _parse_iso_datetime(options['since'])
+            if since is None:
+                raise ValueError(f"Invalid date format: {options['since']}")
+            return since
         
         # Determine what we're trying to sync
         current_scope = self._determine_sync_scope(options)
@@ -659,15 +1238,23 @@ class Command(BaseCommand):
                 self.stdout.write(f"Error getting dandiset {dandiset_id}: {e}")
                 return
         else:
+            # The whole listing is checked with _dandiset_needs_update: the
+            # API's -modified ordering is not guaranteed to sort by the same
+            # timestamp as RemoteDandiset.modified, so stopping early could
+            # skip a changed dandiset
             api_dandisets = list(self.client.get_dandisets())
         
         # Filter dandisets that need updating using REST API modification dates
         dandisets_to_process = []
         
         def check_dandiset(api_dandiset):
+            if self._normalize_dandiset_id(api_dandiset.identifier) in SKIP_DANDISET_IDS:
+                if self.verbose:
+                    self.stdout.write(f"Skipping dandiset {api_dandiset.identifier} as requested")
+                return
             if self._dandiset_needs_update(api_dandiset, last_sync_time):
                 dandisets_to_process.append(api_dandiset)
-            self.stats['dandisets_checked'] += 1
+            self.stats.dandisets_checked += 1
         
         self._process_with_progress(
             api_dandisets,
@@ -683,14 +1270,49 @@ class Command(BaseCommand):
             self.stdout.write("No dandisets need updates")
             return
         
-        # Process each dandiset using AWS S3 for metadata download
-        self._process_with_progress(
-            dandisets_to_process,
-            lambda ds: self._process_dandiset_and_assets_from_yaml(ds, last_sync_time, options, sync_scope, sync_tracker),
-            "Processing dandisets and assets using AWS S3",
-            unit="dandiset",
-            postfix_func=lambda ds: {"current": ds.identifier}
-        )
+        # Process each dandiset using AWS S3 for metadata download. The YAML
+        # files of the next few dandisets download in the background while
+        # the current one is written; all database work stays on this thread.
+        upcoming = iter(dandisets_to_process)
+        
+        def prefetch_next():
+            api_dandiset = next(upcoming, None)
+            if api_dandiset is not None:
+                self._prefetch_dandiset_yaml(api_dandiset, options, sync_scope)
+        
+        def process_dandiset(api_dandiset):
+            prefetch_next()
+            self._process_dandiset_and_assets_from_yaml(api_dandiset, last_sync_time, options, sync_scope, sync_tracker)
+        
+        try:
+            for _ in range(self.max_workers):
+                prefetch_next()
+            self._process_with_progress(
+                dandisets_to_process,
+                process_dandiset,
+                "Processing dandisets and assets using AWS S3",
+                unit="dandiset",
+                postfix_func=lambda ds: {"current": ds.identifier}
+            )
+        finally:
+            for prefetch in self._yaml_prefetches.values():
+                prefetch.cancel()
+            self._yaml_prefetches.clear()
+
+    def _prefetch_dandiset_yaml(self, api_dandiset, options, sync_scope):
+        """Start background downloads of the YAML files a dandiset will need"""
+        if self.pool is None:
+            return
+        normalized_id = self._normalize_dandiset_id(api_dandiset.identifier)
+        filenames = []
+        if sync_scope in ['full', 'dandisets'] and not self.dry_run:
+            filenames.append('dandiset.yaml')
+        if sync_scope in ['full', 'assets'] and not options['dandisets_only']:
+            filenames.append('assets.yaml')
+        for filename in filenames:
+            self._yaml_prefetches[(normalized_id, filename)] = self.pool.submit(
+                self._download_yaml_from_s3, normalized_id, filename
+            )
 
     def _process_dandiset_and_assets_from_yaml(
         self, 
@@ -742,7 +1364,7 @@ class Command(BaseCommand):
         2. **Assets processing**: Downloads `assets.yaml` from S3 and processes all
            asset metadata (if sync_scope allows)
            
-        The method automatically skips dandiset 000026 as requested and handles
+        Dandisets in SKIP_DANDISET_IDS never reach this method; it handles
         cases where YAML files are not available in S3. It uses database transactions
         to ensure data consistency and includes comprehensive error handling.
         
@@ -768,25 +1390,19 @@ class Command(BaseCommand):
             if dandiset_id.startswith('DANDI:'):
                 dandiset_id = dandiset_id[6:]
             
-            # Skip dandiset 000026
-            if dandiset_id == '000026':
-                if self.verbose:
-                    self.stdout.write(f"Skipping dandiset 000026 as requested")
-                return
-            
             # Step 1: Update dandiset metadata using YAML from S3 (if not assets-only)
             if sync_scope in ['full', 'dandisets']:
                 if self.dry_run:
                     if self.verbose:
                         self.stdout.write(f"Would update dandiset: {api_dandiset.identifier}")
-                    self.stats['dandisets_updated'] += 1
+                    self.stats.dandisets_updated += 1
                 else:
                     # Download dandiset YAML metadata from S3
                     dandiset_data = self.download_yaml_from_s3(dandiset_id, 'dandiset.yaml')
                     if dandiset_data:
                         with transaction.atomic():
                             dandiset = self._load_dandiset(dandiset_data, sync_tracker)
-                            self.stats['dandisets_updated'] += 1
+                            self.stats.dandisets_updated += 1
                             if self.verbose:
                                 self.stdout.write(f"Updated dandiset: {api_dandiset.identifier}")
                     else:
@@ -798,11 +1414,9 @@ class Command(BaseCommand):
             if sync_scope in ['full', 'assets'] and not options['dandisets_only']:
                 # Get local dandiset for asset relationships
                 if not dandiset:
-                    try:
-                        # Try to find existing dandiset by base_id
-                        normalized_id = self._normalize_dandiset_id(dandiset_id)
-                        dandiset = Dandiset.objects.get(base_id__endswith=normalized_id)
-                    except Dandiset.DoesNotExist:
+                    # Try to find existing dandiset by base_id
+                    dandiset = self._get_local_dandiset(dandiset_id)
+                    if dandiset is None:
                         if self.verbose:
                             self.stdout.write(f"Local dandiset not found for {api_dandiset.identifier}, skipping assets")
                         return
@@ -810,7 +1424,9 @@ class Command(BaseCommand):
                 self._process_assets_for_dandiset_from_yaml(dandiset_id, dandiset, last_sync_time, options, sync_tracker)
                 
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
+            # Any rows created in the rolled-back transaction are gone
+            self._invalidate_lookup_caches()
             if self.verbose:
                 self.stdout.write(f"Error processing dandiset {api_dandiset.identifier}: {e}")
 
@@ -890,12 +1506,12 @@ class Command(BaseCommand):
                 if self.dry_run:
                     if self.verbose:
                         self.stdout.write(f"Would update dandiset: {api_dandiset.identifier}")
-                    self.stats['dandisets_updated'] += 1
+                    self.stats.dandisets_updated += 1
                 else:
                     with transaction.atomic():
                         metadata = api_dandiset.get_raw_metadata()
                         dandiset = self._load_dandiset(metadata, sync_tracker)
-                        self.stats['dandisets_updated'] += 1
+                        self.stats.dandisets_updated += 1
                         if self.verbose:
                             self.stdout.write(f"Updated dandiset: {api_dandiset.identifier}")
             
@@ -914,7 +1530,9 @@ class Command(BaseCommand):
                 self._process_assets_for_dandiset(api_dandiset, dandiset, last_sync_time, options, sync_tracker)
                 
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
+            # Any rows created in the rolled-back transaction are gone
+            self._invalidate_lookup_caches()
             if self.verbose:
                 self.stdout.write(f"Error processing dandiset {api_dandiset.identifier}: {e}")
 
@@ -965,14 +1583,14 @@ class Command(BaseCommand):
         
         1. **YAML Download**: Downloads `assets.yaml` from S3 using the normalized
            dandiset ID to construct the S3 path
-        2. **Data Validation**: Validates that the downloaded data is a proper list
-           and handles cases where no assets are found
+        2. **Streaming**: Consumes the asset entries one at a time, so only the
+           current write batch is held in memory rather than the whole list
         3. **Summary Calculation**: Computes total bytes, file count, and unique
            subjects from the asset data to validate/update the dandiset summary
         4. **Asset Limiting**: Applies the max_assets limit to prevent processing
            too many assets in a single operation
-        5. **Bulk Processing**: Processes all assets using progress tracking,
-           filtering by modification time and updating asset metadata
+        5. **Bulk Processing**: Checks and writes assets in batches of
+           `batch_size`, filtering by modification time and updating asset metadata
         6. **Deletion Detection**: Identifies and handles assets that exist locally
            but are no longer present in the YAML file
            
@@ -997,53 +1615,93 @@ class Command(BaseCommand):
         ... )
         """
         try:
-            # Download assets YAML metadata from S3
+            # Download assets YAML metadata from S3; entries are yielded one at
+            # a time so only the current write batch is held in memory
             assets_data = self.download_yaml_from_s3(dandiset_id, 'assets.yaml')
-            if not assets_data:
+            if assets_data is None:
                 if self.verbose:
                     self.stdout.write(f"Could not download assets YAML for {dandiset_id}")
                 # Even if no YAML assets, check for deleted assets
-                self._check_for_deleted_assets_in_dandiset_from_yaml(local_dandiset, [], options)
-                return
-            
-            if not isinstance(assets_data, list):
-                if self.verbose:
-                    self.stdout.write(f"Invalid assets data format for {dandiset_id} - expected list, got {type(assets_data)}")
+                self._check_for_deleted_assets_in_dandiset_from_yaml(local_dandiset, set(), options)
                 return
             
-            if not assets_data:
-                if self.verbose:
-                    self.stdout.write(f"No assets found for {dandiset_id}")
-                # Check for deleted assets
-                self._check_for_deleted_assets_in_dandiset_from_yaml(local_dandiset, [], options)
-                return
-            
-            # Calculate correct summary data from assets before processing
+            # Summary data is accumulated over every entry, while only the
+            # first max_assets entries are checked and written, in batches
+            max_assets = options.get('max_assets', 2000)
             total_bytes = 0
-            total_files = len(assets_data)
+            total_files = 0
             unique_subjects = set()
+            yaml_asset_ids = set()
+            assets_updated = 0
+            batch = []
             
-            for asset_data in assets_data:
+            def process_batch():
+                nonlocal assets_updated
+                local_dates = None
+                if last_sync_time:
+                    local_dates = self._prefetch_asset_dates([
+                        self._extract_asset_id(asset_data) for asset_data in batch
+                    ])
+                changed_assets = []
+                for asset_data in batch:
+                    if self._asset_needs_update_from_yaml(asset_data, last_sync_time, local_dates):
+                        changed_assets.append(asset_data)
+                    self.stats.assets_checked += 1
+                    self._record_sync_progress()
+                self._update_assets_from_yaml(changed_assets, local_dandiset, sync_tracker)
+                assets_updated += len(changed_assets)
+                batch.clear()
+            
+            def process_asset(asset_data):
+                nonlocal total_bytes, total_files
+                if not isinstance(asset_data, dict):
+                    raise ValueError(f"expected asset entries to be mappings, got {type(asset_data).__name__}")
+                total_files += 1
                 # Sum up content sizes
                 content_size = asset_data.get('contentSize', 0)
                 if isinstance(content_size, (int, float)):
                     total_bytes += content_size
-                
                 # Collect unique subjects from participants
                 for participant_data in asset_data.get('wasAttributedTo', []):
                     participant_id = participant_data.get('identifier')
                     if participant_id:
                         unique_subjects.add(participant_id)
+                
+                if total_files > max_assets:
+                    return
+                asset_id = self._extract_asset_id(asset_data)
+                if asset_id:
+                    yaml_asset_ids.add(asset_id)
+                batch.append(asset_data)
+                if len(batch) >= self.batch_size:
+                    process_batch()
+            
+            self._process_with_progress(
+                assets_data,
+                process_asset,
+                f"Processing assets for {dandiset_id}",
+                unit="asset",
+                leave=False
+            )
+            process_batch()
+            
+            if not total_files:
+                if self.verbose:
+                    self.stdout.write(f"No assets found for {dandiset_id}")
+                # Check for deleted assets
+                self._check_for_deleted_assets_in_dandiset_from_yaml(local_dandiset, set(), options)
+                return
+            
+            if total_files > max_assets and self.verbose:
+                self.stdout.write(f"Limited assets for {dandiset_id} to {max_assets} (total: {total_files})")
             
             # Update the dandiset's assets summary with calculated values if it looks wrong
             if (local_dandiset.assets_summary and 
                 local_dandiset.assets_summary.number_of_files == 0 and 
                 total_files > 0):
-                
                 if self.verbose:
                     self.stdout.write(f"Updating assets summary for {dandiset_id} - "
                                     f"calculated {total_files} files, {total_bytes} bytes from assets.yaml")
-                
                 local_dandiset.assets_summary.number_of_files = total_files
                 local_dandiset.assets_summary.number_of_bytes = total_bytes
                 if unique_subjects:
@@ -1054,40 +1712,14 @@ class Command(BaseCommand):
                 if not self.dry_run:
                     local_dandiset.assets_summary.save()
             
-            # Apply max assets limit
-            max_assets = options.get('max_assets', 2000)
-            if len(assets_data) > max_assets:
-                if self.verbose:
-                    self.stdout.write(f"Limiting assets for {dandiset_id} to {max_assets} (total: {len(assets_data)})")
-                assets_data = assets_data[:max_assets]
-            
-            # Process assets - filter and update in one pass
-            assets_updated = 0
-            
-            def process_asset(asset_data):
-                nonlocal assets_updated
-                if self._asset_needs_update_from_yaml(asset_data, last_sync_time):
-                    self._update_asset_from_yaml(asset_data, local_dandiset, sync_tracker)
-                    assets_updated += 1
-                self.stats['assets_checked'] += 1
-            
-            self._process_with_progress(
-                assets_data,
-                process_asset,
-                f"Processing assets for {dandiset_id}",
-                unit="asset",
-                postfix_func=lambda asset: {"asset": self._truncate_path(asset.get('path', 'unknown'))},
-                leave=False
-            )
-            
-            if self.verbose and assets_updated > 0:
-                self.stdout.write(f"Updated {assets_updated} assets for {dandiset_id}")
+            if self.verbose and assets_updated > 0:
+                self.stdout.write(f"Updated {assets_updated} assets for {dandiset_id}")
             
             # Check for deleted assets in this dandiset
-            self._check_for_deleted_assets_in_dandiset_from_yaml(local_dandiset, assets_data, options)
+            self._check_for_deleted_assets_in_dandiset_from_yaml(local_dandiset, yaml_asset_ids, options)
                 
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
             if self.verbose:
                 self.stdout.write(f"Error processing assets for {dandiset_id}: {e}")
 
@@ -1191,33 +1823,34 @@ class Command(BaseCommand):
                     self.stdout.write(f"Limiting assets for {api_dandiset.identifier} to {max_assets} (total: {len(api_assets)})")
                 api_assets = api_assets[:max_assets]
             
-            # Process assets - filter and update in one pass
-            assets_updated = 0
+            # Load local modification dates for every asset in one pass
+            local_dates = None
+            if last_sync_time:
+                local_dates = self._prefetch_asset_dates([asset.identifier for asset in api_assets])
+                self._prefetch_raw_metadata(api_assets, last_sync_time, local_dates)
             
-            def process_asset(asset):
-                nonlocal assets_updated
-                if self._asset_needs_update(asset, last_sync_time):
-                    self._update_asset(asset, local_dandiset, sync_tracker)
-                    assets_updated += 1
-                self.stats['assets_checked'] += 1
+            # Filter first, then write the changed assets in batches
+            assets_to_update = []
+            with tqdm(api_assets, desc=f"Checking assets for {api_dandiset.identifier}", unit="asset",
+                      leave=False, disable=self.no_progress, mininterval=PROGRESS_MININTERVAL) as asset_pbar:
+                for asset in asset_pbar:
+                    if self._asset_needs_update(asset, last_sync_time, local_dates):
+                        assets_to_update.append(asset)
+                    self.stats.assets_checked += 1
+                    self._record_sync_progress()
             
-            self._process_with_progress(
-                api_assets,
-                process_asset,
-                f"Processing assets for {api_dandiset.identifier}",
-                unit="asset",
-                postfix_func=lambda asset: {"asset": self._truncate_path(getattr(asset, 'path', 'unknown'))},
-                leave=False
-            )
+            for i in range(0, len(assets_to_update), self.batch_size):
+                self._update_assets(assets_to_update[i:i + self.batch_size], local_dandiset, sync_tracker)
+            self._flush_fetched_assets()
             
-            if self.verbose and assets_updated > 0:
-                self.stdout.write(f"Updated {assets_updated} assets for {api_dandiset.identifier}")
+            if self.verbose and assets_to_update:
+                self.stdout.write(f"Updated {len(assets_to_update)} assets for {api_dandiset.identifier}")
             
             # Check for deleted assets in this dandiset
             self._check_for_deleted_assets_in_dandiset(local_dandiset, api_assets, options)
                 
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
             if self.verbose:
                 self.stdout.write(f"Error processing assets for {api_dandiset.identifier}: {e}")
 
@@ -1307,14 +1940,15 @@ class Command(BaseCommand):
             for dandiset in dandisets:
                 if self._dandiset_needs_update(dandiset, last_sync_time):
                     dandisets_to_update.append(dandiset)
-                self.stats['dandisets_checked'] += 1
+                self.stats.dandisets_checked += 1
         else:
-            with tqdm(dandisets, desc=filter_desc, unit="dandiset") as pbar:
-                for dandiset in pbar:
-                    pbar.set_postfix(current=dandiset.identifier)
+            with tqdm(dandisets, desc=filter_desc, unit="dandiset", mininterval=PROGRESS_MININTERVAL) as pbar:
+                for i, dandiset in enumerate(pbar):
+                    if i % PROGRESS_POSTFIX_INTERVAL == 0:
+                        pbar.set_postfix(current=dandiset.identifier, refresh=False)
                     if self._dandiset_needs_update(dandiset, last_sync_time):
                         dandisets_to_update.append(dandiset)
-                    self.stats['dandisets_checked'] += 1
+                    self.stats.dandisets_checked += 1
         
         self.stdout.write(f"Found {len(dandisets_to_update)} dandisets to update")
         
@@ -1327,9 +1961,9 @@ class Command(BaseCommand):
             for dandiset in dandisets_to_update:
                 self._update_dandiset(dandiset)
         else:
-            with tqdm(dandisets_to_update, desc=update_desc, unit="dandiset") as pbar:
+            with tqdm(dandisets_to_update, desc=update_desc, unit="dandiset", mininterval=PROGRESS_MININTERVAL) as pbar:
                 for dandiset in pbar:
-                    pbar.set_postfix(current=dandiset.identifier)
+                    pbar.set_postfix(current=dandiset.identifier, refresh=False)
                     self._update_dandiset(dandiset)
 
     def _sync_assets(
@@ -1408,66 +2042,37 @@ class Command(BaseCommand):
         else:
             dandisets_query = Dandiset.objects.filter(is_latest=True)
         
-        dandisets = list(dandisets_query)
-        
         # Filter to only check assets for dandisets that need updating
         # If a dandiset hasn't been modified, its assets haven't been modified either
         if last_sync_time and not options.get('force_full_sync'):
-            dandisets_to_check = []
-            
             # Get API dandisets to check modification dates
             if self.verbose:
                 self.stdout.write("Filtering dandisets that need asset updates...")
             
-            api_dandisets = {}
             try:
-                for api_ds in self.client.get_dandisets():
-                    api_dandisets[api_ds.identifier] = api_ds
+                api_dandisets = self._get_api_dandisets_dict()
             except Exception as e:
                 if self.verbose:
                     self.stdout.write(f"Error fetching API dandisets: {e}")
                 # Fall back to checking all dandisets if we can't get API list
-                dandisets_to_check = dandisets
+                api_dandisets = {}
             
             if api_dandisets:
-                filter_desc = "Checking which dandisets need asset updates"
-                if self.no_progress:
-                    for dandiset in dandisets:
-                        # Find corresponding API dandiset
-                        api_dandiset = None
-                        for identifier in [dandiset.base_id, dandiset.identifier]:
-                            if identifier in api_dandisets:
-                                api_dandiset = api_dandisets[identifier]
-                                break
-                        
-                        if api_dandiset and self._dandiset_needs_update(api_dandiset, last_sync_time):
-                            dandisets_to_check.append(dandiset)
-                        elif self.verbose and api_dandiset:
-                            self.stdout.write(f"Skipping assets for unchanged dandiset: {dandiset.base_id}")
-                        elif not api_dandiset:
-                            # If we can't find the API dandiset, check it anyway to be safe
-                            dandisets_to_check.append(dandiset)
-                else:
-                    with tqdm(dandisets, desc=filter_desc, unit="dandiset") as filter_pbar:
-                        for dandiset in filter_pbar:
-                            filter_pbar.set_postfix(checking=dandiset.base_id)
-                            
-                            # Find corresponding API dandiset
-                            api_dandiset = None
-                            for identifier in [dandiset.base_id, dandiset.identifier]:
-                                if identifier in api_dandisets:
-                                    api_dandiset = api_dandisets[identifier]
-                                    break
-                            
-                            if api_dandiset and self._dandiset_needs_update(api_dandiset, last_sync_time):
-                                dandisets_to_check.append(dandiset)
-                            elif self.verbose and api_dandiset:
-                                self.stdout.write(f"Skipping assets for unchanged dandiset: {dandiset.base_id}")
-                            elif not api_dandiset:
-                                # If we can't find the API dandiset, check it anyway to be safe
-                                dandisets_to_check.append(dandiset)
-            
-            dandisets = dandisets_to_check
+                changed_ids = [
+                    identifier for identifier, api_dandiset in api_dandisets.items()
+                    if self._dandiset_needs_update(api_dandiset, last_sync_time)
+                ]
+                known_ids = list(api_dandisets)
+                
+                # Match local rows against the API in one query: changed
+                # dandisets, plus any we can't find in the API (checked anyway
+                # to be safe)
+                dandisets_query = dandisets_query.filter(
+                    Q(base_id__in=changed_ids) | Q(identifier__in=changed_ids) |
+                    ~(Q(base_id__in=known_ids) | Q(identifier__in=known_ids))
+                )
+        
+        dandisets = list(dandisets_query)
             
         self.stdout.write(f"Processing assets for {len(dandisets)} dandisets")
         
@@ -1480,9 +2085,9 @@ class Command(BaseCommand):
             for dandiset in dandisets:
                 self._sync_dandiset_assets(dandiset, last_sync_time, options)
         else:
-            with tqdm(dandisets, desc=main_desc, unit="dandiset") as main_pbar:
+            with tqdm(dandisets, desc=main_desc, unit="dandiset", mininterval=PROGRESS_MININTERVAL) as main_pbar:
                 for dandiset in main_pbar:
-                    main_pbar.set_postfix(dandiset=dandiset.base_id)
+                    main_pbar.set_postfix(dandiset=dandiset.base_id, refresh=False)
                     self._sync_dandiset_assets(dandiset, last_sync_time, options)
 
     def _dandiset_needs_update(
@@ -1581,16 +2186,18 @@ class Command(BaseCommand):
         try:
             if self.dry_run:
                 self.stdout.write(f"Would update dandiset: {api_dandiset.identifier}")
-                self.stats['dandisets_updated'] += 1
+                self.stats.dandisets_updated += 1
                 return
             
             with transaction.atomic():
                 metadata = api_dandiset.get_raw_metadata()
                 self._load_dandiset(metadata, sync_tracker)
-                self.stats['dandisets_updated'] += 1
+                self.stats.dandisets_updated += 1
                 
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
+            # Any rows created in the rolled-back transaction are gone
+            self._invalidate_lookup_caches()
             if self.verbose:
                 self.stdout.write(f"Error updating dandiset {api_dandiset.identifier}: {e}")
 
@@ -1607,8 +2214,9 @@ class Command(BaseCommand):
             else:
                 dandiset_number = base_id
             
-            # Try multiple approaches to get the dandiset from the API
-            for attempt_id in [dandiset_number, f"DANDI:{dandiset_number}", base_id]:
+            # Try multiple approaches to get the dandiset from the API;
+            # base_id is usually the same as DANDI:<number>, so skip repeats
+            for attempt_id in dict.fromkeys([dandiset_number, f"DANDI:{dandiset_number}", base_id]):
                 try:
                     if self.verbose:
                         self.stdout.write(f"Trying to get dandiset with ID: {attempt_id}")
@@ -1621,22 +2229,17 @@ class Command(BaseCommand):
                         self.stdout.write(f"Failed to get dandiset with ID {attempt_id}: {e}")
                     continue
             
-            # If direct access fails, try searching through all dandisets
+            # If direct access fails, look it up in the dandiset listing, which
+            # is fetched and indexed once per sync rather than scanned per dandiset
             if not api_dandiset:
                 if self.verbose:
                     self.stdout.write(f"Direct access failed for {base_id}, searching through all dandisets...")
                 
                 try:
-                    for ds in self.client.get_dandisets():
-                        # Try multiple matching approaches
-                        if (ds.identifier == base_id or 
-                            ds.identifier == f"DANDI:{dandiset_number}" or
-                            ds.identifier == dandiset_number or
-                            getattr(ds, 'id', '').endswith(dandiset_number)):
-                            api_dandiset = ds
-                            if self.verbose:
-                                self.stdout.write(f"Found matching dandiset: {ds.identifier}")
-                            break
+                    index = self._get_api_dandiset_index()
+                    api_dandiset = index.get(base_id) or index.get(dandiset_number)
+                    if api_dandiset and self.verbose:
+                        self.stdout.write(f"Found matching dandiset: {api_dandiset.identifier}")
                 except Exception as e:
                     if self.verbose:
                         self.stdout.write(f"Error searching through dandisets: {e}")
@@ -1661,96 +2264,155 @@ class Command(BaseCommand):
             
             # Filter assets that need updating
             assets_to_update = []
+            local_dates = None
+            if last_sync_time:
+                local_dates = self._prefetch_asset_dates([asset.identifier for asset in api_assets])
+                self._prefetch_raw_metadata(api_assets, last_sync_time, local_dates)
             
             asset_filter_desc = f"Checking assets for {dandiset.base_id}"
             if self.no_progress:
                 for asset in api_assets:
-                    if self._asset_needs_update(asset, last_sync_time):
+                    if self._asset_needs_update(asset, last_sync_time, local_dates):
                         assets_to_update.append(asset)
-                    self.stats['assets_checked'] += 1
+                    self.stats.assets_checked += 1
+                    self._record_sync_progress()
             else:
-                with tqdm(api_assets, desc=asset_filter_desc, unit="asset", leave=False) as asset_pbar:
+                # No per-asset postfix: paths scroll too fast to read and the
+                # description already names the dandiset
+                with tqdm(api_assets, desc=asset_filter_desc, unit="asset", leave=False,
+                          mininterval=PROGRESS_MININTERVAL) as asset_pbar:
                     for asset in asset_pbar:
-                        asset_pbar.set_postfix(asset=self._truncate_path(getattr(asset, 'path', 'unknown')))
-                        if self._asset_needs_update(asset, last_sync_time):
+                        if self._asset_needs_update(asset, last_sync_time, local_dates):
                             assets_to_update.append(asset)
-                        self.stats['assets_checked'] += 1
+                        self.stats.assets_checked += 1
+                        self._record_sync_progress()
             
             if not assets_to_update:
                 return
             
             # Update assets
             asset_update_desc = f"Updating assets for {dandiset.base_id}"
+            batches = [
+                assets_to_update[i:i + self.batch_size]
+                for i in range(0, len(assets_to_update), self.batch_size)
+            ]
             if self.no_progress:
-                for asset in assets_to_update:
-                    self._update_asset(asset, dandiset)
+                for batch in batches:
+                    self._update_assets(batch, dandiset)
+                self._flush_fetched_assets()
             else:
-                with tqdm(assets_to_update, desc=asset_update_desc, unit="asset", leave=False) as update_pbar:
-                    for asset in update_pbar:
-                        update_pbar.set_postfix(asset=self._truncate_path(getattr(asset, 'path', 'unknown')))
-                        self._update_asset(asset, dandiset)
+                with tqdm(total=len(assets_to_update), desc=asset_update_desc, unit="asset", leave=False,
+                          mininterval=PROGRESS_MININTERVAL) as update_pbar:
+                    for batch in batches:
+                        self._update_assets(batch, dandiset)
+                        update_pbar.update(len(batch))
+                    self._flush_fetched_assets()
                         
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
             if self.verbose:
                 self.stdout.write(f"Error syncing assets for {dandiset.base_id}: {e}")
 
-    def _asset_needs_update(self, api_asset, last_sync_time):
-        """Check if an asset needs updating"""
+    def _prefetch_asset_dates(self, asset_ids):
+        """Fetch local modification dates and digests for many assets at once.
+
+        Returns ``{dandi_asset_id: (latest, digest)}`` for the ids that exist
+        locally, where ``latest`` is the later of date_modified and
+        blob_date_modified as epoch microseconds (None if neither is set).
+        Queries in chunks of `batch_size` ids to keep the IN lists a
+        reasonable size.
+        """
+        asset_ids = [asset_id for asset_id in asset_ids if asset_id]
+        local_dates = {}
+        for i in range(0, len(asset_ids), self.batch_size):
+            rows = Asset.objects.filter(
+                dandi_asset_id__in=asset_ids[i:i + self.batch_size]
+            ).values_list('dandi_asset_id', 'date_modified', 'blob_date_modified', 'digest')
+            for asset_id, date_modified, blob_date_modified, digest in rows:
+                local_dates[asset_id] = (
+                    _latest_epoch_micros(date_modified, blob_date_modified),
+                    digest,
+                )
+        return local_dates
+
+    def _prefetch_raw_metadata(self, api_assets, last_sync_time, local_dates):
+        """Start fetching, on the worker pool, the raw metadata `_asset_needs_update` will need
+
+        Only assets that exist locally and whose listing was modified after the
+        last sync need their metadata to be compared, so only those are
+        requested; the filter loop then consumes the results in order.
+        """
+        if self.pool is None or not last_sync_time:
+            return
+        for api_asset in api_assets:
+            asset_id = api_asset.identifier
+            local = local_dates.get(asset_id)
+            if local is None or self._listing_unchanged(api_asset, last_sync_time, local[0]):
+                continue
+            self._raw_metadata_futures[asset_id] = self.pool.submit(api_asset.get_raw_metadata)
+
+    def _listing_unchanged(self, api_asset, last_sync_time, latest_local_date):
+        """Check from the asset listing alone that a local asset is up to date
+
+        True when the listing's `modified` is at or before the last sync and
+        the local copy is at least that recent. Checking the local date too
+        means an asset whose write failed during an otherwise completed sync
+        is compared in full, and so retried, on the next one.
+        """
+        listing_modified = _parse_iso_datetime(getattr(api_asset, 'modified', None))
+        if not listing_modified or listing_modified > last_sync_time or latest_local_date is None:
+            return False
+        return latest_local_date >= _latest_epoch_micros(listing_modified)
+
+    def _asset_needs_update(self, api_asset, last_sync_time, local_dates=None):
+        """Check if an asset needs updating
+
+        `local_dates` is an optional mapping from `_prefetch_asset_dates`; without
+        it the local asset is looked up individually.
+        """
         if not last_sync_time:
             return True
         
         try:
-            # Get raw metadata
-            metadata = api_asset.get_raw_metadata()
-            
-            # Check modification dates
-            api_modified = parse_datetime(metadata.get('dateModified'))
-            api_blob_modified = parse_datetime(metadata.get('blobDateModified'))
-            
-            # Use the latest of the two dates
-            latest_api_date = None
-            if api_modified and api_blob_modified:
-                latest_api_date = max(api_modified, api_blob_modified)
-            elif api_modified:
-                latest_api_date = api_modified
-            elif api_blob_modified:
-                latest_api_date = api_blob_modified
-            
-            if not latest_api_date:
-                return True  # No date info, assume needs update
-            
             # Check if we have this asset locally
-            asset_id = metadata.get('identifier', '')
-            if not asset_id and metadata.get('id'):
-                full_id = metadata.get('id', '')
-                if ':' in full_id:
-                    asset_id = full_id.split(':', 1)[1]
-                else:
-                    asset_id = full_id
-            
-            try:
-                local_asset = Asset.objects.get(dandi_asset_id=asset_id)
-                
-                # Compare with local dates
-                local_modified = local_asset.date_modified
-                local_blob_modified = local_asset.blob_date_modified
-                
-                latest_local_date = None
-                if local_modified and local_blob_modified:
-                    latest_local_date = max(local_modified, local_blob_modified)
-                elif local_modified:
-                    latest_local_date = local_modified
-                elif local_blob_modified:
-                    latest_local_date = local_blob_modified
-                
-                if not latest_local_date:
-                    return True
-                
-                return latest_api_date > latest_local_date
-                
-            except Asset.DoesNotExist:
+            asset_id = api_asset.identifier
+            if local_dates is None:
+                local_dates = self._prefetch_asset_dates([asset_id])
+            local = local_dates.get(asset_id)
+            if local is None:
                 return True  # New asset
+            latest_local_date, local_digest = local
+            
+            # The listing already carries the server-side modification time;
+            # an asset untouched since the last sync needs no metadata request
+            if self._listing_unchanged(api_asset, last_sync_time, latest_local_date):
+                return False
+            
+            # Get raw metadata, possibly already fetched in the background
+            future = self._raw_metadata_futures.pop(asset_id, None)
+            metadata = future.result() if future is not None else api_asset.get_raw_metadata()
+            
+            # A changed content digest means the asset changed; no need to
+            # parse dates. An unchanged digest can still come with
+            # metadata-only edits, so fall through to the date check.
+            api_digest = metadata.get('digest')
+            if api_digest and local_digest and api_digest != local_digest:
+                needs_update = True
+            else:
+                # Check modification dates, using the latest of the two
+                latest_api_date = _latest_epoch_micros(
+                    _parse_iso_datetime(metadata.get('dateModified')),
+                    _parse_iso_datetime(metadata.get('blobDateModified')),
+                )
+                # Without date info, assume it needs an update
+                needs_update = (
+                    latest_api_date is None or latest_local_date is None
+                    or latest_api_date > latest_local_date
+                )
+            
+            if needs_update:
+                self._raw_metadata_cache[asset_id] = metadata
+            return needs_update
                 
         except Exception as e:
             if self.verbose:
@@ -1759,82 +2421,145 @@ class Command(BaseCommand):
 
     def _update_asset(self, api_asset, dandiset, sync_tracker=None):
         """Update a single asset"""
-        try:
-            if self.dry_run:
-                asset_path = getattr(api_asset, 'path', 'unknown')
+        self._update_assets([api_asset], dandiset, sync_tracker)
+
+    def _update_assets(self, api_assets, dandiset, sync_tracker=None):
+        """Update a batch of assets fetched from the REST API
+
+        Metadata for the batch is fetched on the metadata thread pool while the
+        previous batch is written, so network and database time overlap; at
+        most two batches are in flight. Callers must call
+        `_flush_fetched_assets` once they are done submitting batches.
+        """
+        if not api_assets:
+            return
+        
+        if self.dry_run:
+            for api_asset in api_assets:
+                self._raw_metadata_cache.pop(api_asset.identifier, None)
                 if self.verbose:
+                    asset_path = getattr(api_asset, 'path', 'unknown')
                     self.stdout.write(f"Would update asset: {asset_path}")
-                self.stats['assets_updated'] += 1
-                return
-            
+            self.stats.assets_updated += len(api_assets)
+            return
+        
+        # Metadata already fetched by _asset_needs_update is reused; only the
+        # rest is requested
+        fetchers = []
+        for api_asset in api_assets:
+            metadata = self._raw_metadata_cache.pop(api_asset.identifier, None)
+            if metadata is not None:
+                fetchers.append(lambda metadata=metadata: metadata)
+            elif self.pool is None:
+                fetchers.append(api_asset.get_raw_metadata)
+            else:
+                fetchers.append(self.pool.submit(api_asset.get_raw_metadata).result)
+        
+        if self.pool is None:
+            self._save_fetched_assets(fetchers, dandiset, sync_tracker)
+            return
+        
+        fetching = (fetchers, dandiset, sync_tracker)
+        self._flush_fetched_assets()
+        self._fetching_batch = fetching
+
+    def _flush_fetched_assets(self):
+        """Write the batch whose metadata `_update_assets` is still fetching, if any"""
+        if self._fetching_batch is None:
+            return
+        fetchers, dandiset, sync_tracker = self._fetching_batch
+        self._fetching_batch = None
+        self._save_fetched_assets(fetchers, dandiset, sync_tracker)
+
+    def _save_fetched_assets(self, fetchers, dandiset, sync_tracker=None):
+        """Collect asset metadata from `fetchers` (callables) and save it as one batch"""
+        try:
+            assets_data = [fetch() for fetch in fetchers]
+        except Exception as e:
+            self.stats.errors += 1
+            if self.verbose:
+                self.stdout.write(f"Error fetching asset metadata for {dandiset.base_id}: {e}")
+            return
+        
+        self._save_asset_batch(assets_data, dandiset, sync_tracker)
+
+    def _save_asset_batch(self, assets_data, dandiset, sync_tracker=None):
+        """Write a batch of asset metadata in one transaction, then sync LINDI for NWB assets.
+
+        If the batch fails it is rolled back and retried one asset at a time, so
+        a single bad record only costs its own update.
+        """
+        try:
             with transaction.atomic():
-                metadata = api_asset.get_raw_metadata()
-                asset = self._load_asset(metadata, dandiset, sync_tracker)
-                self.stats['assets_updated'] += 1
-                
-                # After updating the asset, try to sync LINDI metadata if it's an NWB file
-                if not self.options.get('skip_lindi', False) and asset and asset.encoding_format == 'application/x-nwb':
-                    self._process_lindi_for_asset(asset, sync_tracker)
-                
+                assets = self._load_assets(assets_data, dandiset, sync_tracker)
         except Exception as e:
-            self.stats['errors'] += 1
+            # Any rows created in the rolled-back transaction are gone
+            self._invalidate_lookup_caches()
+            if len(assets_data) > 1:
+                if self.verbose:
+                    self.stdout.write(f"Error updating batch of {len(assets_data)} assets, retrying individually: {e}")
+                for asset_data in assets_data:
+                    self._save_asset_batch([asset_data], dandiset, sync_tracker)
+                return
+            self.stats.errors += 1
             if self.verbose:
-                asset_path = getattr(api_asset, 'path', 'unknown')
+                asset_path = assets_data[0].get('path', 'unknown')
                 self.stdout.write(f"Error updating asset {asset_path}: {e}")
+            return
+        
+        self.stats.assets_updated += len(assets)
+        
+        # After updating the assets, try to sync LINDI metadata for NWB files.
+        # This runs outside the transaction so slow downloads don't hold it open.
+        if not self.options.get('skip_lindi', False):
+            nwb_assets = [asset for asset in assets if asset.encoding_format == 'application/x-nwb']
+            if nwb_assets:
+                lindi_asset_ids = self._lindi_asset_ids(nwb_assets)
+                to_process = []
+                for asset in nwb_assets:
+                    if asset.pk in lindi_asset_ids:
+                        if self.verbose:
+                            self.stdout.write(f"Asset {asset.dandi_asset_id} already has LINDI metadata, skipping")
+                        self.stats.lindi_skipped += 1
+                    else:
+                        to_process.append(asset)
+                self._process_lindi_for_assets(to_process, sync_tracker)
+
+    def _asset_needs_update_from_yaml(self, asset_data, last_sync_time, local_dates=None):
+        """Check if an asset needs updating based on YAML data
 
-    def _asset_needs_update_from_yaml(self, asset_data, last_sync_time):
-        """Check if an asset needs updating based on YAML data"""
+        `local_dates` is an optional mapping from `_prefetch_asset_dates`; without
+        it the local asset is looked up individually.
+        """
         if not last_sync_time:
             return True
         
         try:
-            # Check modification dates from YAML
-            api_modified = parse_datetime(asset_data.get('dateModified'))
-            api_blob_modified = parse_datetime(asset_data.get('blobDateModified'))
-            
-            # Use the latest of the two dates
-            latest_api_date = None
-            if api_modified and api_blob_modified:
-                latest_api_date = max(api_modified, api_blob_modified)
-            elif api_modified:
-                latest_api_date = api_modified
-            elif api_blob_modified:
-                latest_api_date = api_blob_modified
-            
-            if not latest_api_date:
-                return True  # No date info, assume needs update
-            
             # Check if we have this asset locally
-            asset_id = asset_data.get('identifier', '')
-            if not asset_id and asset_data.get('id'):
-                full_id = asset_data.get('id', '')
-                if ':' in full_id:
-                    asset_id = full_id.split(':', 1)[1]
-                else:
-                    asset_id = full_id
-            
-            try:
-                local_asset = Asset.objects.get(dandi_asset_id=asset_id)
-                
-                # Compare with local dates
-                local_modified = local_asset.date_modified
-                local_blob_modified = local_asset.blob_date_modified
-                
-                latest_local_date = None
-                if local_modified and local_blob_modified:
-                    latest_local_date = max(local_modified, local_blob_modified)
-                elif local_modified:
-                    latest_local_date = local_modified
-                elif local_blob_modified:
-                    latest_local_date = local_blob_modified
-                
-                if not latest_local_date:
-                    return True
-                
-                return latest_api_date > latest_local_date
-                
-            except Asset.DoesNotExist:
+            asset_id = self._extract_asset_id(asset_data)
+            if local_dates is None:
+                local_dates = self._prefetch_asset_dates([asset_id])
+            local = local_dates.get(asset_id)
+            if local is None:
                 return True  # New asset
+            latest_local_date, local_digest = local
+            
+            # A changed content digest means the asset changed; no need to
+            # parse dates. An unchanged digest can still come with
+            # metadata-only edits, so fall through to the date check.
+            api_digest = asset_data.get('digest')
+            if api_digest and local_digest and api_digest != local_digest:
+                return True
+            
+            # Check modification dates, using the latest of the two
+            latest_api_date = _latest_epoch_micros(
+                _parse_iso_datetime(asset_data.get('dateModified')),
+                _parse_iso_datetime(asset_data.get('blobDateModified')),
+            )
+            if latest_api_date is None or latest_local_date is None:
+                return True  # No date info, assume needs update
+            
+            return latest_api_date > latest_local_date
                 
         except Exception as e:
             if self.verbose:
@@ -1843,102 +2568,98 @@ class Command(BaseCommand):
 
     def _update_asset_from_yaml(self, asset_data, dandiset, sync_tracker=None):
         """Update a single asset from YAML data"""
-        try:
-            if self.dry_run:
-                asset_path = asset_data.get('path', 'unknown')
+        self._update_assets_from_yaml([asset_data], dandiset, sync_tracker)
+
+    def _update_assets_from_yaml(self, assets_data, dandiset, sync_tracker=None):
+        """Update a batch of assets from YAML data"""
+        if not assets_data:
+            return
+        
+        if self.dry_run:
+            for asset_data in assets_data:
                 if self.verbose:
+                    asset_path = asset_data.get('path', 'unknown')
                     self.stdout.write(f"Would update asset: {asset_path}")
-                self.stats['assets_updated'] += 1
-                return
-            
-            with transaction.atomic():
-                asset = self._load_asset(asset_data, dandiset, sync_tracker)
-                self.stats['assets_updated'] += 1
-                
-                # After updating the asset, try to sync LINDI metadata if it's an NWB file
-                if not self.options.get('skip_lindi', False) and asset and asset.encoding_format == 'application/x-nwb':
-                    self._process_lindi_for_asset(asset, sync_tracker)
-                
-        except Exception as e:
-            self.stats['errors'] += 1
-            if self.verbose:
-                asset_path = asset_data.get('path', 'unknown')
-                self.stdout.write(f"Error updating asset {asset_path}: {e}")
+            self.stats.assets_updated += len(assets_data)
+            return
+        
+        self._save_asset_batch(assets_data, dandiset, sync_tracker)
 
-    def _check_for_deleted_assets_in_dandiset_from_yaml(self, local_dandiset, assets_data, options):
-        """Check for assets that exist locally but not in the YAML for this specific dandiset"""
+    @staticmethod
+    def _extract_asset_id(asset_data):
+        """Return the bare asset id of asset metadata, falling back to 'dandiasset:<id>'"""
+        return asset_data.get('identifier') or (asset_data.get('id') or '').split(':', 1)[-1]
+
+    def _check_for_deleted_assets_in_dandiset_from_yaml(self, local_dandiset, yaml_asset_ids, options):
+        """Check for assets that exist locally but not in the YAML for this specific dandiset
+
+        `yaml_asset_ids` is the set of bare asset ids present in assets.yaml.
+        """
         try:
-            # Create set of asset IDs from YAML for fast lookup
-            yaml_asset_ids = set()
-            for asset_data in assets_data:
-                asset_id = asset_data.get('identifier', '')
-                if not asset_id and asset_data.get('id'):
-                    full_id = asset_data.get('id', '')
-                    if ':' in full_id:
-                        asset_id = full_id.split(':', 1)[1]
-                    else:
-                        asset_id = full_id
-                if asset_id:
-                    yaml_asset_ids.add(asset_id)
-            
-            # Get all local assets that belong to this dandiset
-            local_assets = local_dandiset.assets.all()
-            
-            assets_to_delete = []
-            
-            for local_asset in local_assets:
-                if local_asset.dandi_asset_id not in yaml_asset_ids:
-                    # Check if this asset belongs to other dandisets before adding to deletion list
-                    if local_asset.dandisets.count() == 1:
-                        # Asset only belongs to this dandiset - safe to delete completely
-                        assets_to_delete.append(('delete_asset', local_asset))
-                        if self.verbose:
-                            self.stdout.write(f"Asset {local_asset.dandi_asset_id} will be deleted (only belongs to {local_dandiset.base_id})")
-                    else:
-                        # Asset belongs to multiple dandisets - only remove the relationship
-                        assets_to_delete.append(('remove_relationship', local_asset))
-                        if self.verbose:
-                            self.stdout.write(f"Asset {local_asset.dandi_asset_id} relationship will be removed from {local_dandiset.base_id} (belongs to multiple dandisets)")
-            
-            if not assets_to_delete:
-                if self.verbose:
-                    self.stdout.write(f"No deleted assets found in dandiset {local_dandiset.base_id}")
-                return
-            
-            if self.verbose:
-                self.stdout.write(f"Found {len(assets_to_delete)} assets to process for deletion in dandiset {local_dandiset.base_id}")
-            
-            # Process the assets
-            for action, asset in assets_to_delete:
-                if self.dry_run:
-                    if action == 'delete_asset':
-                        if self.verbose:
-                            self.stdout.write(f"Would delete asset: {asset.path}")
-                    else:
-                        if self.verbose:
-                            self.stdout.write(f"Would remove relationship for asset: {asset.path}")
-                    self.stats['assets_deleted'] += 1
-                else:
-                    with transaction.atomic():
-                        if action == 'delete_asset':
-                            if self.verbose:
-                                self.stdout.write(f"Deleting asset: {asset.path}")
-                            asset.delete()
-                        else:
-                            if self.verbose:
-                                self.stdout.write(f"Removing relationship for asset: {asset.path}")
-                            AssetDandiset.objects.filter(
-                                asset=asset,
-                                dandiset=local_dandiset
-                            ).delete()
-                        
-                        self.stats['assets_deleted'] += 1
-                        
+            self._delete_missing_local_assets(local_dandiset, yaml_asset_ids)
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
             if self.verbose:
                 self.stdout.write(f"Error checking for deleted assets in dandiset {local_dandiset.base_id}: {e}")
 
+    def _delete_missing_local_assets(self, local_dandiset, remote_asset_ids):
+        """Remove local assets of a dandiset whose ids are not in `remote_asset_ids`
+
+        Assets that only belong to this dandiset are deleted; assets shared with
+        other dandisets only lose their link to this one. Uses a fixed number
+        of queries per `batch_size` missing assets rather than several per asset.
+        """
+        missing = [
+            (pk, dandi_asset_id)
+            for pk, dandi_asset_id in local_dandiset.assets.values_list('pk', 'dandi_asset_id')
+            if dandi_asset_id not in remote_asset_ids
+        ]
+        if not missing:
+            if self.verbose:
+                self.stdout.write(f"No deleted assets found in dandiset {local_dandiset.base_id}")
+            return
+        
+        # Assets that also belong to another dandiset must survive
+        missing_pks = [pk for pk, _ in missing]
+        shared_pks = set()
+        for i in range(0, len(missing_pks), self.batch_size):
+            shared_pks.update(
+                AssetDandiset.objects.filter(asset_id__in=missing_pks[i:i + self.batch_size])
+                .exclude(dandiset=local_dandiset)
+                .values_list('asset_id', flat=True)
+            )
+        
+        delete_pks = []
+        unlink_pks = []
+        for pk, dandi_asset_id in missing:
+            if pk in shared_pks:
+                unlink_pks.append(pk)
+                if self.verbose:
+                    self.stdout.write(f"Asset {dandi_asset_id} relationship will be removed from {local_dandiset.base_id} (belongs to multiple dandisets)")
+            else:
+                delete_pks.append(pk)
+                if self.verbose:
+                    self.stdout.write(f"Asset {dandi_asset_id} will be deleted (only belongs to {local_dandiset.base_id})")
+        
+        if self.verbose:
+            self.stdout.write(f"Found {len(missing)} assets to process for deletion in dandiset {local_dandiset.base_id}")
+        
+        if self.dry_run:
+            self.stats.assets_deleted += len(missing)
+            return
+        
+        # One transaction for the whole dandiset rather than one per asset
+        with transaction.atomic():
+            for i in range(0, len(delete_pks), self.batch_size):
+                Asset.objects.filter(pk__in=delete_pks[i:i + self.batch_size]).delete()
+            for i in range(0, len(unlink_pks), self.batch_size):
+                AssetDandiset.objects.filter(
+                    dandiset=local_dandiset,
+                    asset_id__in=unlink_pks[i:i + self.batch_size],
+                ).delete()
+        
+        self.stats.assets_deleted += len(missing)
+
     def _sync_lindi_metadata_only(self, options, sync_tracker=None):
         """Sync LINDI metadata only for existing NWB assets without touching DANDI API data"""
         self.stdout.write("Starting LINDI-only metadata sync...")
@@ -1946,263 +2667,120 @@ class Command(BaseCommand):
         # Build query for NWB assets
         query = Q(encoding_format='application/x-nwb')
         
-        # Filter by dandiset if specified
+        # Filter by dandiset if specified. An asset is linked to every version
+        # of a dandiset, so match through a subquery on the (indexed) exact
+        # base_id rather than a join that would need DISTINCT
         dandiset_filter = options.get('dandiset_filter') or options.get('dandiset_id')
         if dandiset_filter:
             dandiset_filter = self._normalize_dandiset_id(dandiset_filter)
-            query &= Q(dandisets__base_id__endswith=dandiset_filter)
+            query &= Q(pk__in=AssetDandiset.objects.filter(
+                dandiset__base_id=f"DANDI:{dandiset_filter}"
+            ).values('asset_id'))
             
             if self.verbose:
                 self.stdout.write(f"Filtering assets for dandiset: {dandiset_filter}")
         
-        # Get NWB assets
-        nwb_assets = Asset.objects.filter(query).distinct()
+        # Get NWB assets; LINDI processing only reads these columns
+        nwb_assets = Asset.objects.filter(query).only('id', 'dandi_asset_id')
         
-        if not nwb_assets.exists():
+        total_assets = nwb_assets.count()
+        if not total_assets:
             self.stdout.write("No NWB assets found matching criteria")
             return
         
-        total_assets = nwb_assets.count()
         self.stdout.write(f"Found {total_assets} NWB assets to process")
         
-        # Combined filtering and processing in a single pass
-        def process_asset_if_needed(asset):
-            # Check if asset needs LINDI processing
-            needs_processing = False
-            
-            # Check if force refresh is enabled
-            if options.get('force_lindi_refresh'):
-                needs_processing = True
-            else:
-                # Check if asset already has LINDI metadata
-                try:
-                    LindiMetadata.objects.get(asset=asset)
-                    # Asset already has LINDI metadata
-                    needs_processing = False
-                except LindiMetadata.DoesNotExist:
-                    needs_processing = True
-            
-            if needs_processing:
-                # Process the asset immediately
-                self._process_lindi_for_existing_asset(asset, sync_tracker)
-            else:
-                self.stats['lindi_skipped'] += 1
+        # Assets that already have LINDI metadata are excluded in SQL, so
+        # they are counted once instead of being loaded and checked one by one
+        force_refresh = options.get('force_lindi_refresh', False)
+        if not force_refresh:
+            nwb_assets = nwb_assets.filter(lindi_metadata__isnull=True)
+            assets_to_process = nwb_assets.count()
+            already_processed = total_assets - assets_to_process
+            if already_processed:
+                self.stdout.write(f"Skipping {already_processed} assets that already have LINDI metadata")
+            self.stats.lindi_skipped += already_processed
+            self.stats.assets_checked += already_processed
+            self._record_sync_progress()
+            total_assets = assets_to_process
+            if not total_assets:
+                return
+        
+        # Assets are handed over in small chunks so their downloads overlap
+        pending = []
+        chunk_size = self.max_workers * 4
+        
+        def queue_asset(asset):
+            if force_refresh and self.verbose:
+                self.stdout.write(f"Force refreshing LINDI metadata for: {asset.dandi_asset_id}")
+            pending.append(asset)
+            if len(pending) >= chunk_size:
+                self._process_lindi_for_assets(pending, sync_tracker)
+                pending.clear()
             
-            self.stats['assets_checked'] += 1
+            self.stats.assets_checked += 1
+            self._record_sync_progress()
         
         # Process assets with combined filtering and processing
         process_desc = "Processing LINDI metadata for assets"
         
+        # Stream the rows in chunks instead of caching the whole queryset
         self._process_with_progress(
-            nwb_assets,
-            process_asset_if_needed,
+            nwb_assets.iterator(chunk_size=1000),
+            queue_asset,
             process_desc,
             unit="asset",
-            postfix_func=lambda asset: {"asset": self._truncate_path(asset.path)},
-            leave=True
+            postfix_func=lambda asset: {"asset": asset.dandi_asset_id},
+            leave=True,
+            total=total_assets
         )
+        if pending:
+            self._process_lindi_for_assets(pending, sync_tracker)
+
+    def _sync_tracker_counters(self):
+        """Return the running counters as SyncTracker field values"""
+        stats = self.stats
+        return {
+            'dandisets_synced': stats.dandisets_checked,
+            'assets_synced': stats.assets_checked,
+            'dandisets_updated': stats.dandisets_updated,
+            'assets_updated': stats.assets_updated,
+        }
 
-    def _process_lindi_parallel(self, assets_to_process, sync_tracker, options):
-        """Process LINDI metadata for multiple assets in parallel"""
-        max_workers = options.get('max_workers', 4)
-        self.stdout.write(f"Using parallel processing with {max_workers} workers")
-        
-        # Thread-safe statistics tracking
-        stats_lock = threading.Lock()
-        
-        def process_single_asset(asset):
-            """Process a single asset - used by worker threads"""
-            try:
-                # Use helper method to determine if asset should be processed
-                should_process = self._should_process_lindi_for_asset(
-                    asset, 
-                    force_refresh=options.get('force_lindi_refresh', False)
-                )
-                
-                if not should_process:
-                    with stats_lock:
-                        self.stats['lindi_skipped'] += 1
-                        self.stats['assets_checked'] += 1
-                    return f"Skipped {asset.dandi_asset_id} (already has metadata)"
-
-                # Construct LINDI URL
-                lindi_url = self._construct_lindi_url(asset)
-                if not lindi_url:
-                    with stats_lock:
-                        self.stats['lindi_skipped'] += 1
-                        self.stats['assets_checked'] += 1
-                    return f"Skipped {asset.dandi_asset_id} (no URL)"
-
-                # Download LINDI file (each worker has its own session)
-                worker_session = requests.Session()
-                worker_session.headers.update(self.session.headers)
-                
-                try:
-                    response = worker_session.get(lindi_url, timeout=self.timeout)
-                    response.raise_for_status()
-                    lindi_data = response.json()
-                except Exception as e:
-                    with stats_lock:
-                        self.stats['lindi_errors'] += 1
-                        self.stats['assets_checked'] += 1
-                    return f"Error downloading {asset.dandi_asset_id}: {e}"
-                finally:
-                    worker_session.close()
-
-                # Filter LINDI data
-                filtered_data = self._filter_lindi_data(lindi_data)
-
-                # Save to database (ensure each worker has its own connection)
-                if not self.dry_run:
-                    try:
-                        # Close any existing connection to ensure clean state
-                        connections.close_all()
-                        
-                        with transaction.atomic():
-                            lindi_metadata, created = LindiMetadata.objects.update_or_create(
-                                asset=asset,
-                                defaults={
-                                    'structure_metadata': filtered_data,
-                                    'lindi_url': lindi_url,
-                                    'processing_version': '1.0',
-                                    'sync_tracker': sync_tracker,
-                                }
-                            )
-                        
-                        with stats_lock:
-                            self.stats['lindi_processed'] += 1
-                            self.stats['assets_checked'] += 1
-                        
-                        action = "Created" if created else "Updated"
-                        return f"{action} LINDI metadata for {asset.dandi_asset_id}"
-                        
-                    except Exception as e:
-                        with stats_lock:
-                            self.stats['lindi_errors'] += 1
-                            self.stats['assets_checked'] += 1
-                        return f"Error saving {asset.dandi_asset_id}: {e}"
-                else:
-                    with stats_lock:
-                        self.stats['lindi_processed'] += 1
-                        self.stats['assets_checked'] += 1
-                    return f"Would process LINDI metadata for {asset.dandi_asset_id}"
-                    
-            except Exception as e:
-                with stats_lock:
-                    self.stats['lindi_errors'] += 1
-                    self.stats['assets_checked'] += 1
-                return f"Unexpected error processing {asset.dandi_asset_id}: {e}"
-
-        # Process assets in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            if self.no_progress:
-                # Submit all jobs and wait for completion
-                futures = {executor.submit(process_single_asset, asset): asset for asset in assets_to_process}
-                
-                for future in as_completed(futures):
-                    asset = futures[future]
-                    try:
-                        result = future.result()
-                        if self.verbose:
-                            self.stdout.write(result)
-                    except Exception as exc:
-                        if self.verbose:
-                            self.stdout.write(f'Asset {asset.dandi_asset_id} generated an exception: {exc}')
-            else:
-                # Use progress bar
-                futures = {executor.submit(process_single_asset, asset): asset for asset in assets_to_process}
-                
-                with tqdm(total=len(assets_to_process), desc="Processing LINDI metadata (parallel)", unit="asset") as pbar:
-                    for future in as_completed(futures):
-                        asset = futures[future]
-                        try:
-                            result = future.result()
-                            pbar.set_postfix(asset=self._truncate_path(asset.path))
-                            if self.verbose:
-                                self.stdout.write(result)
-                        except Exception as exc:
-                            if self.verbose:
-                                self.stdout.write(f'Asset {asset.dandi_asset_id} generated an exception: {exc}')
-                        finally:
-                            pbar.update(1)
-
-        # Ensure all database connections are closed after parallel processing
-        connections.close_all()
-
-    def _process_lindi_for_existing_asset(self, asset, sync_tracker=None):
-        """Process LINDI metadata for an existing asset (used in LINDI-only sync)"""
-        try:
-            # Use helper method to determine if asset should be processed
-            should_process = self._should_process_lindi_for_asset(
-                asset, 
-                force_refresh=self.options.get('force_lindi_refresh', False)
-            )
-            
-            if should_process and self.options.get('force_lindi_refresh') and self.verbose:
-                self.stdout.write(f"Force refreshing LINDI metadata for: {asset.path}")
-            
-            if not should_process:
-                if self.verbose:
-                    self.stdout.write(f"Asset {asset.dandi_asset_id} already has LINDI metadata, skipping")
-                self.stats['lindi_skipped'] += 1
-                return
-
-            # Construct LINDI URL
-            lindi_url = self._construct_lindi_url(asset)
-            if not lindi_url:
-                if self.verbose:
-                    self.stdout.write(f"Could not construct LINDI URL for asset {asset.dandi_asset_id}")
-                self.stats['lindi_skipped'] += 1
-                return
-
-            # Download and process LINDI file
-            lindi_data = self._download_lindi_file(lindi_url)
-            if not lindi_data:
-                self.stats['lindi_errors'] += 1
-                return
-
-            # Filter LINDI data
-            filtered_data = self._filter_lindi_data(lindi_data)
-
-            # Save to database (don't skip in dry run for LINDI-only sync)
-            if self.dry_run:
-                if self.verbose:
-                    self.stdout.write(f"Would process LINDI metadata for: {asset.path}")
-                self.stats['lindi_processed'] += 1
-            else:
-                self._save_lindi_metadata(asset, lindi_url, lindi_data, filtered_data, sync_tracker)
-                self.stats['lindi_processed'] += 1
+    def _record_sync_progress(self):
+        """Persist running counters to the sync tracker every `commit_interval` checked assets.
 
-                if self.verbose:
-                    self.stdout.write(f"Processed LINDI metadata for: {asset.path}")
-
-        except Exception as e:
-            self.stats['lindi_errors'] += 1
-            if self.verbose:
-                self.stdout.write(f"Error processing LINDI for asset {asset.dandi_asset_id}: {e}")
+        Uses a single narrow UPDATE rather than `save()` so the running tracker
+        reflects progress (and survives a crash) without reloading the row.
+        """
+        if not self.sync_tracker or not self.commit_interval:
+            return
+        # Compare against the last checkpoint rather than testing with modulo:
+        # some callers advance the counter by more than one at a time
+        if self.stats.assets_checked - self._last_checkpoint < self.commit_interval:
+            return
+        self._last_checkpoint = self.stats.assets_checked
+        SyncTracker.objects.filter(pk=self.sync_tracker.pk).update(**self._sync_tracker_counters())
 
     def _record_sync_completion(self, sync_tracker, duration):
         """Record sync completion in database"""
-        sync_tracker.status = 'completed'
-        sync_tracker.last_sync_timestamp = datetime.now(timezone.utc)
-        sync_tracker.dandisets_synced = self.stats['dandisets_checked']
-        sync_tracker.assets_synced = self.stats['assets_checked']
-        sync_tracker.dandisets_updated = self.stats['dandisets_updated']
-        sync_tracker.assets_updated = self.stats['assets_updated']
-        sync_tracker.sync_duration_seconds = duration
-        sync_tracker.save()
+        self._finish_sync_tracker(sync_tracker, status='completed', sync_duration_seconds=duration)
 
     def _record_sync_failure(self, sync_tracker, duration, error_message):
         """Record sync failure in database"""
-        sync_tracker.status = 'failed'
-        sync_tracker.last_sync_timestamp = datetime.now(timezone.utc)
-        sync_tracker.dandisets_synced = self.stats['dandisets_checked']
-        sync_tracker.assets_synced = self.stats['assets_checked']
-        sync_tracker.dandisets_updated = self.stats['dandisets_updated']
-        sync_tracker.assets_updated = self.stats['assets_updated']
-        sync_tracker.sync_duration_seconds = duration
-        sync_tracker.error_message = error_message[:1000] if error_message else ''  # Truncate if too long
-        sync_tracker.save()
+        self._finish_sync_tracker(
+            sync_tracker,
+            status='failed',
+            sync_duration_seconds=duration,
+            error_message=error_message[:1000] if error_message else '',  # Truncate if too long
+        )
+
+    def _finish_sync_tracker(self, sync_tracker, **fields):
+        """Write the final tracker state with one UPDATE of the changed columns only"""
+        fields.update(self._sync_tracker_counters(), last_sync_timestamp=self.sync_started_at)
+        SyncTracker.objects.filter(pk=sync_tracker.pk).update(**fields)
+        for name, value in fields.items():
+            setattr(sync_tracker, name, value)
 
     def _print_summary(self, duration):
         """Print sync summary"""
@@ -2210,28 +2788,28 @@ class Command(BaseCommand):
         self.stdout.write("UNIFIED SYNC SUMMARY")
         self.stdout.write("="*50)
         self.stdout.write(f"Duration: {duration:.2f} seconds")
-        self.stdout.write(f"Dandisets checked: {self.stats['dandisets_checked']}")
-        self.stdout.write(f"Dandisets updated: {self.stats['dandisets_updated']}")
-        self.stdout.write(f"Dandisets deleted: {self.stats['dandisets_deleted']}")
-        self.stdout.write(f"Assets checked: {self.stats['assets_checked']}")
-        self.stdout.write(f"Assets updated: {self.stats['assets_updated']}")
-        self.stdout.write(f"Assets deleted: {self.stats['assets_deleted']}")
+        self.stdout.write(f"Dandisets checked: {self.stats.dandisets_checked}")
+        self.stdout.write(f"Dandisets updated: {self.stats.dandisets_updated}")
+        self.stdout.write(f"Dandisets deleted: {self.stats.dandisets_deleted}")
+        self.stdout.write(f"Assets checked: {self.stats.assets_checked}")
+        self.stdout.write(f"Assets updated: {self.stats.assets_updated}")
+        self.stdout.write(f"Assets deleted: {self.stats.assets_deleted}")
         
         # Show cache statistics
-        total_cache_requests = self.stats['cache_hits'] + self.stats['cache_misses']
+        total_cache_requests = self.stats.cache_hits + self.stats.cache_misses
         if total_cache_requests > 0:
-            cache_hit_rate = (self.stats['cache_hits'] / total_cache_requests) * 100
-            self.stdout.write(f"YAML cache hits: {self.stats['cache_hits']}")
-            self.stdout.write(f"YAML cache misses: {self.stats['cache_misses']}")
+            cache_hit_rate = (self.stats.cache_hits / total_cache_requests) * 100
+            self.stdout.write(f"YAML cache hits: {self.stats.cache_hits}")
+            self.stdout.write(f"YAML cache misses: {self.stats.cache_misses}")
             self.stdout.write(f"YAML cache hit rate: {cache_hit_rate:.1f}%")
         
         # Show LINDI statistics only if LINDI processing was enabled
         if not self.options.get('skip_lindi', False):
-            self.stdout.write(f"LINDI metadata processed: {self.stats['lindi_processed']}")
-            self.stdout.write(f"LINDI metadata skipped: {self.stats['lindi_skipped']}")
-            self.stdout.write(f"LINDI errors: {self.stats['lindi_errors']}")
+            self.stdout.write(f"LINDI metadata processed: {self.stats.lindi_processed}")
+            self.stdout.write(f"LINDI metadata skipped: {self.stats.lindi_skipped}")
+            self.stdout.write(f"LINDI errors: {self.stats.lindi_errors}")
         
-        self.stdout.write(f"Total errors: {self.stats['errors']}")
+        self.stdout.write(f"Total errors: {self.stats.errors}")
         
         if self.dry_run:
             self.stdout.write(self.style.WARNING("DRY RUN - No changes were made"))
@@ -2278,20 +2856,23 @@ class Command(BaseCommand):
                 if self.dry_run:
                     if self.verbose:
                         self.stdout.write(f"Would delete dandiset: {dandiset.base_id}")
-                    self.stats['dandisets_deleted'] += 1
+                    self.stats.dandisets_deleted += 1
                 else:
                     if self.verbose:
                         self.stdout.write(f"Deleting dandiset: {dandiset.base_id}")
                     
                     with transaction.atomic():
-                        # Also delete related assets that only belong to this dandiset
-                        for asset in dandiset.assets.all():
-                            if asset.dandisets.count() == 1:  # Only belongs to this dandiset
-                                asset.delete()
-                                self.stats['assets_deleted'] += 1
+                        # Also delete related assets that only belong to this
+                        # dandiset, as one queryset delete rather than a
+                        # COUNT and DELETE per asset
+                        orphan_assets = Asset.objects.filter(dandisets=dandiset).exclude(
+                            pk__in=AssetDandiset.objects.exclude(dandiset=dandiset).values('asset_id')
+                        )
+                        _, deleted = orphan_assets.delete()
+                        self.stats.assets_deleted += deleted.get(Asset._meta.label, 0)
                         
                         dandiset.delete()
-                        self.stats['dandisets_deleted'] += 1
+                        self.stats.dandisets_deleted += 1
             
             # Delete dandisets
             self._process_with_progress(
@@ -2303,87 +2884,19 @@ class Command(BaseCommand):
             )
             
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
             if self.verbose:
                 self.stdout.write(f"Error checking for deleted dandisets: {e}")
 
     def _check_for_deleted_assets_in_dandiset(self, local_dandiset, api_assets, options):
         """Check for assets that exist locally but not in the API for this specific dandiset"""
         try:
-            # Create set of API asset IDs for fast lookup
-            api_asset_ids = set()
-            for api_asset in api_assets:
-                try:
-                    metadata = api_asset.get_raw_metadata()
-                    asset_id = metadata.get('identifier', '')
-                    if not asset_id and metadata.get('id'):
-                        full_id = metadata.get('id', '')
-                        if ':' in full_id:
-                            asset_id = full_id.split(':', 1)[1]
-                        else:
-                            asset_id = full_id
-                    if asset_id:
-                        api_asset_ids.add(asset_id)
-                except Exception as e:
-                    if self.verbose:
-                        self.stdout.write(f"Error getting asset ID from API asset: {e}")
-                    continue
-            
-            # Get all local assets that belong to this dandiset
-            local_assets = local_dandiset.assets.all()
-            
-            assets_to_delete = []
-            
-            for local_asset in local_assets:
-                if local_asset.dandi_asset_id not in api_asset_ids:
-                    # Check if this asset belongs to other dandisets before adding to deletion list
-                    if local_asset.dandisets.count() == 1:
-                        # Asset only belongs to this dandiset - safe to delete completely
-                        assets_to_delete.append(('delete_asset', local_asset))
-                        if self.verbose:
-                            self.stdout.write(f"Asset {local_asset.dandi_asset_id} will be deleted (only belongs to {local_dandiset.base_id})")
-                    else:
-                        # Asset belongs to multiple dandisets - only remove the relationship
-                        assets_to_delete.append(('remove_relationship', local_asset))
-                        if self.verbose:
-                            self.stdout.write(f"Asset {local_asset.dandi_asset_id} relationship will be removed from {local_dandiset.base_id} (belongs to multiple dandisets)")
-            
-            if not assets_to_delete:
-                if self.verbose:
-                    self.stdout.write(f"No deleted assets found in dandiset {local_dandiset.base_id}")
-                return
-            
-            if self.verbose:
-                self.stdout.write(f"Found {len(assets_to_delete)} assets to process for deletion in dandiset {local_dandiset.base_id}")
-            
-            # Process the assets
-            for action, asset in assets_to_delete:
-                if self.dry_run:
-                    if action == 'delete_asset':
-                        if self.verbose:
-                            self.stdout.write(f"Would delete asset: {asset.path}")
-                    else:
-                        if self.verbose:
-                            self.stdout.write(f"Would remove relationship for asset: {asset.path}")
-                    self.stats['assets_deleted'] += 1
-                else:
-                    with transaction.atomic():
-                        if action == 'delete_asset':
-                            if self.verbose:
-                                self.stdout.write(f"Deleting asset: {asset.path}")
-                            asset.delete()
-                        else:
-                            if self.verbose:
-                                self.stdout.write(f"Removing relationship for asset: {asset.path}")
-                            AssetDandiset.objects.filter(
-                                asset=asset,
-                                dandiset=local_dandiset
-                            ).delete()
-                        
-                        self.stats['assets_deleted'] += 1
-                        
+            # The listing already carries each asset's identifier, so no
+            # metadata requests are needed
+            api_asset_ids = {api_asset.identifier for api_asset in api_assets if api_asset.identifier}
+            self._delete_missing_local_assets(local_dandiset, api_asset_ids)
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
             if self.verbose:
                 self.stdout.write(f"Error checking for deleted assets in dandiset {local_dandiset.base_id}: {e}")
 
@@ -2432,9 +2945,9 @@ class Command(BaseCommand):
                 'citation': data.get('citation', ''),
                 'schema_version': data.get('schemaVersion', ''),
                 'repository': data.get('repository', ''),
-                'date_created': parse_datetime(data.get('dateCreated')) if data.get('dateCreated') else None,
-                'date_modified': parse_datetime(data.get('dateModified')) if data.get('dateModified') else None,
-                'date_published': parse_datetime(data.get('datePublished')) if data.get('datePublished') else None,
+                'date_created': _parse_iso_datetime(data.get('dateCreated')),
+                'date_modified': _parse_iso_datetime(data.get('dateModified')),
+                'date_published': _parse_iso_datetime(data.get('datePublished')),
                 'license': data.get('license', []),
                 'keywords': data.get('keywords', []),
                 'study_target': data.get('studyTarget', []),
@@ -2445,78 +2958,107 @@ class Command(BaseCommand):
             }
         )
         
+        # Fields set after the upsert are collected and written with a single
+        # narrow UPDATE instead of a full-row save() each
+        post_update = {}
+        
         # Set created_by_sync for new dandisets
         if created and sync_tracker:
             dandiset.created_by_sync = sync_tracker
-            dandiset.save()
+            post_update['created_by_sync'] = sync_tracker
 
         if self.verbose:
             action = "Created" if created else "Updated"
             self.stdout.write(f"{action} dandiset: {dandiset.name}")
 
-        # Load contributors
+        # Load contributors. Relationships are merged in memory against one
+        # prefetch and written with a bulk_create/bulk_update, and unchanged
+        # relationships are not written at all.
+        existing_relationships = {} if created else {
+            relationship.contributor_id: relationship
+            for relationship in DandisetContributor.objects.filter(dandiset=dandiset)
+        }
+        new_relationships = {}
+        changed_relationships = {}
         for contributor_data in data.get('contributor', []):
             contributor = self._load_contributor(contributor_data)
-            if contributor:
-                # Create the relationship with role information
-                relationship, created = DandisetContributor.objects.get_or_create(
+            if not contributor:
+                continue
+
+            new_roles = contributor_data.get('roleName', [])
+            if not isinstance(new_roles, list):
+                new_roles = [new_roles]
+
+            relationship = (
+                existing_relationships.get(contributor.pk)
+                or new_relationships.get(contributor.pk)
+            )
+            if relationship is None:
+                new_relationships[contributor.pk] = DandisetContributor(
                     dandiset=dandiset,
                     contributor=contributor,
-                    defaults={
-                        'role_name': contributor_data.get('roleName', []),
-                        'include_in_citation': contributor_data.get('includeInCitation', True),
-                    }
+                    role_name=list(dict.fromkeys(new_roles)),
+                    include_in_citation=contributor_data.get('includeInCitation', True),
                 )
-                
-                # Update existing relationships with new role data if needed
-                if not created:
-                    updated = False
-                    new_roles = contributor_data.get('roleName', [])
-                    if new_roles and new_roles != relationship.role_name:
-                        # Merge roles - keep existing and add new ones
-                        existing_roles = set(relationship.role_name) if relationship.role_name else set()
-                        new_role_set = set(new_roles) if isinstance(new_roles, list) else {new_roles}
-                        merged_roles = list(existing_roles | new_role_set)
-                        relationship.role_name = merged_roles
-                        updated = True
-                    
-                    include_in_citation = contributor_data.get('includeInCitation')
-                    if include_in_citation is not None and include_in_citation != relationship.include_in_citation:
-                        relationship.include_in_citation = include_in_citation
-                        updated = True
-                    
-                    if updated:
-                        relationship.save()
+                continue
+
+            # Merge roles - keep existing and add new ones
+            updated = False
+            existing_roles = relationship.role_name or []
+            added_roles = [role for role in dict.fromkeys(new_roles) if role not in existing_roles]
+            if added_roles:
+                relationship.role_name = list(existing_roles) + added_roles
+                updated = True
+
+            include_in_citation = contributor_data.get('includeInCitation')
+            if include_in_citation is not None and include_in_citation != relationship.include_in_citation:
+                relationship.include_in_citation = include_in_citation
+                updated = True
+
+            if updated and contributor.pk in existing_relationships:
+                changed_relationships[contributor.pk] = relationship
+
+        self._flush_affiliations()
+        if new_relationships:
+            DandisetContributor.objects.bulk_create(new_relationships.values())
+        if changed_relationships:
+            DandisetContributor.objects.bulk_update(
+                changed_relationships.values(), ['role_name', 'include_in_citation']
+            )
 
-        # Load about section - now using direct many-to-many relationships
+        # Load about section - now using direct many-to-many relationships.
+        # Objects are grouped per field so each field gets a single add()
+        about_objs = defaultdict(list)
         for about_data in data.get('about', []):
             about_obj, field_name = self._load_about_object(about_data)
             if about_obj and field_name:
-                # Use the appropriate many-to-many field on the dandiset
-                if field_name == 'anatomy':
-                    dandiset.anatomy.add(about_obj)
-                elif field_name == 'disorder':
-                    dandiset.disorders.add(about_obj)
-                elif field_name == 'generic_type':
-                    dandiset.generic_types.add(about_obj)
-
-        # Load access requirements - using intermediate model
-        for access_data in data.get('access', []):
-            access_req = self._load_access_requirements(access_data)
-            if access_req:
-                DandisetAccessRequirements.objects.get_or_create(
-                    dandiset=dandiset,
-                    access_requirement=access_req
-                )
+                about_objs[field_name].append(about_obj)
+        # Use the appropriate many-to-many field on the dandiset
+        if about_objs['anatomy']:
+            dandiset.anatomy.add(*about_objs['anatomy'])
+        if about_objs['disorder']:
+            dandiset.disorders.add(*about_objs['disorder'])
+        if about_objs['generic_type']:
+            dandiset.generic_types.add(*about_objs['generic_type'])
+
+        # Load access requirements - using intermediate model. ignore_conflicts
+        # keeps existing links, as get_or_create did
+        access_links = [
+            DandisetAccessRequirements(dandiset=dandiset, access_requirement=access_req)
+            for access_req in map(self._load_access_requirements, data.get('access', []))
+            if access_req
+        ]
+        if access_links:
+            DandisetAccessRequirements.objects.bulk_create(access_links, ignore_conflicts=True)
 
         # Load related resources - using intermediate model
-        for resource_data in data.get('relatedResource', []):
-            resource = self._load_resource(resource_data)
-            if resource:
-                DandisetRelatedResource.objects.get_or_create(
-                    dandiset=dandiset,
-                    resource=resource
-                )
+        resource_links = [
+            DandisetRelatedResource(dandiset=dandiset, resource=resource)
+            for resource in map(self._load_resource, data.get('relatedResource', []))
+            if resource
+        ]
+        if resource_links:
+            DandisetRelatedResource.objects.bulk_create(resource_links, ignore_conflicts=True)
 
         # Load assets summary
         assets_summary_data = data.get('assetsSummary')
@@ -2524,7 +3066,7 @@ class Command(BaseCommand):
             assets_summary = self._load_assets_summary(assets_summary_data)
             if assets_summary:
                 dandiset.assets_summary = assets_summary
-                dandiset.save()
+                post_update['assets_summary'] = assets_summary
 
         # Load published by activity
         published_by_data = data.get('publishedBy')
@@ -2532,111 +3074,224 @@ class Command(BaseCommand):
             activity = self._load_activity(published_by_data)
             if activity:
                 dandiset.published_by = activity
-                dandiset.save()
+                post_update['published_by'] = activity
+
+        if post_update:
+            Dandiset.objects.filter(pk=dandiset.pk).update(**post_update)
+
+        return dandiset
 
     def _load_asset(self, data, dandiset, sync_tracker=None):
         """Load an asset from JSON data."""
-        # Extract asset ID from the full ID
-        asset_id = data.get('identifier', '')
-        if not asset_id:
-            # Try to extract from id field like "dandiasset:a0a7ee60-6e67-42fa-aa88-d31b6b2cb95c"
-            full_id = data.get('id', '')
-            if ':' in full_id:
-                asset_id = full_id.split(':', 1)[1]
-            else:
-                asset_id = full_id
+        return self._load_assets([data], dandiset, sync_tracker)[0]
 
-        # Prepare sync tracking fields
-        sync_fields = {}
+    def _load_assets(self, assets_data, dandiset, sync_tracker=None):
+        """Load a batch of assets from JSON data.
+
+        The asset rows are upserted with a single INSERT ... ON CONFLICT DO UPDATE
+        per `batch_size` rows instead of an update_or_create round-trip per asset;
+        relationships are then loaded per asset. Returns the saved assets in the
+        same order as `assets_data`.
+        """
+        assets_by_id = {}
+        asset_ids = []
+        for data in assets_data:
+            get = data.get
+            # Falls back to the id field, like "dandiasset:a0a7ee60-6e67-42fa-aa88-d31b6b2cb95c"
+            asset_id = self._extract_asset_id(data)
+            asset_ids.append(asset_id)
+
+            # Later duplicates win; ON CONFLICT cannot touch the same row twice
+            assets_by_id[asset_id] = Asset(
+                dandi_asset_id=asset_id,
+                identifier=asset_id,
+                content_size=get('contentSize', 0),
+                encoding_format=get('encodingFormat', ''),
+                schema_version=get('schemaVersion', '0.6.7'),
+                date_modified=_parse_iso_datetime(get('dateModified')),
+                date_published=_parse_iso_datetime(get('datePublished')),
+                blob_date_modified=_parse_iso_datetime(get('blobDateModified')),
+                digest=get('digest', {}),
+                content_url=get('contentUrl', []),
+                variable_measured=get('variableMeasured', []),
+                # created_by_sync is only written on insert (it is not in the
+                # update fields below), which matches "set for new assets"
+                created_by_sync=sync_tracker,
+                last_modified_by_sync=sync_tracker,
+            )
+
+        update_fields = list(ASSET_UPSERT_FIELDS)
         if sync_tracker:
-            sync_fields['last_modified_by_sync'] = sync_tracker
+            update_fields.append('last_modified_by_sync')
 
-        asset, created = Asset.objects.update_or_create(
-            dandi_asset_id=asset_id,
-            defaults={
-                'identifier': asset_id,
-                'content_size': data.get('contentSize', 0),
-                'encoding_format': data.get('encodingFormat', ''),
-                'schema_version': data.get('schemaVersion', '0.6.7'),
-                'date_modified': self._parse_datetime_with_timezone(data.get('dateModified')),
-                'date_published': self._parse_datetime_with_timezone(data.get('datePublished')),
-                'blob_date_modified': self._parse_datetime_with_timezone(data.get('blobDateModified')),
-                'digest': data.get('digest', {}),
-                'content_url': data.get('contentUrl', []),
-                'variable_measured': data.get('variableMeasured', []),
-                **sync_fields
-            }
+        use_copy = self.copy_load or (
+            len(assets_by_id) >= COPY_LOAD_MIN_ROWS and connection.vendor == 'postgresql'
         )
-        
-        # Set created_by_sync for new assets
-        if created and sync_tracker:
-            asset.created_by_sync = sync_tracker
-            asset.save()
+        if use_copy:
+            self._copy_upsert_assets(list(assets_by_id.values()), update_fields)
+        else:
+            Asset.objects.bulk_create(
+                list(assets_by_id.values()),
+                update_conflicts=True,
+                unique_fields=['dandi_asset_id'],
+                update_fields=update_fields,
+                batch_size=self.batch_size,
+            )
 
-        if self.verbose:
-            action = "Created" if created else "Updated"
-            # Get path from the data we're loading
-            path_from_data = data.get('path', 'unknown')
-            self.stdout.write(f"{action} asset: {path_from_data}")
+        # Drop links left over from a batch that failed before flushing
+        self._m2m_buffers.clear()
+        assets = []
+        published = {}
+        for data, asset_id in zip(assets_data, asset_ids):
+            asset = assets_by_id[asset_id]
+            if self.verbose:
+                # Get path from the data we're loading
+                path_from_data = data.get('path', 'unknown')
+                self.stdout.write(f"Upserted asset: {path_from_data}")
+            if self._load_asset_relations(asset, data, dandiset):
+                published[asset.pk] = asset
+            assets.append(asset)
+        self._flush_m2m()
+        if published:
+            # Only published_by is written; the instances also carry
+            # insert-only values such as created_by_sync
+            Asset.objects.bulk_update(published.values(), ['published_by'], batch_size=self.batch_size)
+        return assets
+
+    def _copy_upsert_assets(self, assets, update_fields):
+        """Upsert unsaved Asset instances through COPY and a staging table.
+
+        The rows are streamed into a temporary table with COPY FROM STDIN and
+        moved into the asset table with one INSERT ... SELECT ... ON CONFLICT
+        DO UPDATE, which avoids the per-value parameter binding of a multi-row
+        INSERT. Primary keys are set back on `assets`, as bulk_create does.
+        Requires psycopg2 (``cursor.copy_expert``).
+        """
+        if not assets:
+            return
 
-        # Create the asset-dandiset relationship with path
-        asset_path = data.get('path', '')
-        AssetDandiset.objects.get_or_create(
-            asset=asset,
-            dandiset=dandiset,
-            defaults={
-                'path': asset_path,
-                'is_primary': True
-            }
+        fields = [field for field in Asset._meta.concrete_fields if not field.primary_key]
+        buf = io.StringIO()
+        for asset in assets:
+            buf.write('\t'.join(
+                _copy_text_value(field, field.pre_save(asset, add=True))
+                for field in fields
+            ))
+            buf.write('\n')
+        buf.seek(0)
+
+        qn = connection.ops.quote_name
+        table = qn(Asset._meta.db_table)
+        staging = qn(f"{Asset._meta.db_table}_copy_staging")
+        columns = ', '.join(qn(field.column) for field in fields)
+        updates = ', '.join(
+            f"{qn(column)} = EXCLUDED.{qn(column)}"
+            for column in (Asset._meta.get_field(name).column for name in update_fields)
         )
+        unique_column = qn(Asset._meta.get_field('dandi_asset_id').column)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table} WITH NO DATA"
+            )
+            cursor.copy_expert(f"COPY {staging} ({columns}) FROM STDIN", buf)
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} "
+                f"ON CONFLICT ({unique_column}) DO UPDATE SET {updates} "
+                f"RETURNING {qn(Asset._meta.pk.column)}, {unique_column}"
+            )
+            pks = {asset_id: pk for pk, asset_id in cursor.fetchall()}
+
+        for asset in assets:
+            asset.pk = pks[asset.dandi_asset_id]
+            asset._state.adding = False
+            asset._state.db = connection.alias
+
+    def _queue_m2m(self, field_name, asset, target):
+        """Buffer an Asset many-to-many link for the next `_flush_m2m` call"""
+        through, source_attname, target_attname = _asset_m2m_link(field_name)
+        self._m2m_buffers[through].append(through(**{
+            source_attname: asset.pk,
+            target_attname: target.pk,
+        }))
+
+    def _flush_m2m(self):
+        """Insert all buffered through-table rows, skipping links that already exist"""
+        for through, rows in self._m2m_buffers.items():
+            if rows:
+                through.objects.bulk_create(rows, ignore_conflicts=True, batch_size=5000)
+        self._m2m_buffers.clear()
+
+    def _load_asset_relations(self, asset, data, dandiset):
+        """Queue the dandiset link and many-to-many relationships of a saved asset.
+
+        Links are buffered and written by `_flush_m2m`; ignore_conflicts keeps
+        existing links (and an existing dandiset path) untouched, as the
+        previous get_or_create/add calls did. Returns True if `published_by`
+        was set on the instance and still needs to be written.
+        """
+        get = data.get
+        queue_m2m = self._queue_m2m
+
+        # Create the asset-dandiset relationship with path
+        asset_path = get('path', '')
+        self._m2m_buffers[AssetDandiset].append(AssetDandiset(
+            asset_id=asset.pk,
+            dandiset_id=dandiset.pk,
+            path=asset_path,
+            is_primary=True,
+        ))
 
         # Load access requirements - now using direct many-to-many relationship
-        for access_data in data.get('access', []):
+        for access_data in get('access', []):
             access_req = self._load_access_requirements(access_data)
             if access_req:
-                asset.access_requirements.add(access_req)
+                queue_m2m('access_requirements', asset, access_req)
 
         # Load approaches - now using direct many-to-many relationship
-        for approach_data in data.get('approach', []):
-            approach, _ = ApproachType.objects.get_or_create(
-                name=approach_data.get('name', ''),
+        for approach_data in get('approach', []):
+            approach = self._get_or_create_type(
+                ApproachType,
+                approach_data.get('name', ''),
                 defaults={
                     'identifier': approach_data.get('identifier', ''),
                 }
             )
-            asset.approaches.add(approach)
+            queue_m2m('approaches', asset, approach)
 
         # Load measurement techniques - now using direct many-to-many relationship
-        for technique_data in data.get('measurementTechnique', []):
-            technique, _ = MeasurementTechniqueType.objects.get_or_create(
-                name=technique_data.get('name', ''),
+        for technique_data in get('measurementTechnique', []):
+            technique = self._get_or_create_type(
+                MeasurementTechniqueType,
+                technique_data.get('name', ''),
                 defaults={
                     'identifier': technique_data.get('identifier', ''),
                 }
             )
-            asset.measurement_techniques.add(technique)
+            queue_m2m('measurement_techniques', asset, technique)
 
         # Load participants (wasAttributedTo) - now using direct many-to-many relationship
-        for participant_data in data.get('wasAttributedTo', []):
+        for participant_data in get('wasAttributedTo', []):
             participant = self._load_participant(participant_data)
             if participant:
-                asset.participants.add(participant)
+                queue_m2m('participants', asset, participant)
 
         # Load activities that generated this asset - now using direct many-to-many relationship
-        for activity_data in data.get('wasGeneratedBy', []):
+        for activity_data in get('wasGeneratedBy', []):
             activity = self._load_activity(activity_data)
             if activity:
-                asset.activities.add(activity)
+                queue_m2m('activities', asset, activity)
 
         # Load published by activity
-        published_by_data = data.get('publishedBy')
+        published_by_data = get('publishedBy')
         if published_by_data:
             activity = self._load_activity(published_by_data)
             if activity:
                 asset.published_by = activity
-                asset.save()
-
-        return asset
+                return True
+        return False
 
     # Copy all the helper methods from load_sample_data.py
     def _load_contributor(self, data):
@@ -2652,6 +3307,8 @@ class Command(BaseCommand):
             identifier = data.get('identifier', '').strip() if data.get('identifier') else ''
             email = data.get('email', '').strip() if data.get('email') else ''
             
+            by_identifier, by_email, by_name = self._get_contributor_caches()
+            
             # Try to find existing contributor by identifier first (if provided)
             contributor = None
             if identifier:
@@ -2659,70 +3316,59 @@ class Command(BaseCommand):
                 identifier = self._normalize_contributor_identifier(identifier)
                 
                 # Look for existing contributor with this identifier
-                existing_contributors = Contributor.objects.filter(identifier=identifier)
-                if existing_contributors.exists():
-                    contributor = existing_contributors.first()
-                    if self.verbose and contributor:
-                        self.stdout.write(f"Found existing contributor by identifier {identifier}: {contributor.name}")
+                contributor = by_identifier.get(identifier)
+                if self.verbose and contributor:
+                    self.stdout.write(f"Found existing contributor by identifier {identifier}: {contributor.name}")
             
             # If no contributor found by identifier, try by email (if provided)
             if not contributor and email:
-                existing_contributors = Contributor.objects.filter(email=email)
-                if existing_contributors.exists():
-                    contributor = existing_contributors.first()
-                    if self.verbose and contributor:
-                        self.stdout.write(f"Found existing contributor by email {email}: {contributor.name}")
+                contributor = by_email.get(email)
+                if self.verbose and contributor:
+                    self.stdout.write(f"Found existing contributor by email {email}: {contributor.name}")
             
             # If no contributor found by identifier or email, try by name
             if not contributor:
-                contributor, created = Contributor.objects.get_or_create(
-                    name=name,
-                    defaults={
-                        'email': email,
-                        'identifier': identifier,
-                        'schema_key': data.get('schemaKey', 'Contributor'),
-                        'award_number': data.get('awardNumber', ''),
-                        'url': data.get('url', ''),
-                    }
-                )
-                if created and self.verbose:
-                    self.stdout.write(f"Created new contributor: {name}")
+                contributor = by_name.get(name)
+                if contributor is None:
+                    contributor = Contributor.objects.create(
+                        name=name,
+                        email=email,
+                        identifier=identifier,
+                        schema_key=data.get('schemaKey', 'Contributor'),
+                        award_number=data.get('awardNumber', ''),
+                        url=data.get('url', ''),
+                    )
+                    self._cache_contributor(contributor)
+                    if self.verbose:
+                        self.stdout.write(f"Created new contributor: {name}")
             else:
                 # Update existing contributor with any missing information
-                updated = False
+                updated_fields = []
                 if not contributor.email and email:
                     contributor.email = email
-                    updated = True
+                    updated_fields.append('email')
                 if not contributor.url and data.get('url'):
                     contributor.url = data.get('url')
-                    updated = True
+                    updated_fields.append('url')
                 if not contributor.award_number and data.get('awardNumber'):
                     contributor.award_number = data.get('awardNumber')
-                    updated = True
+                    updated_fields.append('award_number')
                 if not contributor.identifier and identifier:
                     contributor.identifier = identifier
-                    updated = True
+                    updated_fields.append('identifier')
                 
                 # Note: Role names are now stored in DandisetContributor relationships,
                 # not on the Contributor model itself
                 
-                if updated:
-                    contributor.save()
+                if updated_fields:
+                    contributor.save(update_fields=updated_fields)
+                    self._cache_contributor(contributor)
                     if self.verbose:
                         self.stdout.write(f"Updated existing contributor: {contributor.name}")
 
-            # Load affiliations
+            # Queue affiliations; they are written by _flush_affiliations
             for affiliation_data in data.get('affiliation', []):
-                affiliation, _ = Affiliation.objects.get_or_create(
-                    name=affiliation_data.get('name', ''),
-                    defaults={
-                        'identifier': affiliation_data.get('identifier', ''),
-                    }
-                )
-                ContributorAffiliation.objects.get_or_create(
-                    contributor=contributor,
-                    affiliation=affiliation
-                )
+                self._pending_affiliations.append((contributor.pk, affiliation_data))
 
             return contributor
         except Exception as e:
@@ -2730,8 +3376,54 @@ class Command(BaseCommand):
                 self.stdout.write(f"Error loading contributor: {e}")
             return None
 
+    def _flush_affiliations(self):
+        """Create the affiliations and contributor links queued by `_load_contributor`.
+
+        Unknown affiliation names are inserted with one bulk_create and the
+        links with one bulk_create(ignore_conflicts=True), instead of two
+        get_or_create calls per affiliation.
+        """
+        if not self._pending_affiliations:
+            return
+        pending, self._pending_affiliations = self._pending_affiliations, []
+
+        if self._affiliation_cache is None:
+            # Newest first so the oldest row wins on duplicate names
+            self._affiliation_cache = {
+                name: pk for name, pk in Affiliation.objects.order_by('-pk').values_list('name', 'pk')
+            }
+        cache = self._affiliation_cache
+
+        new_affiliations = {}
+        for _, affiliation_data in pending:
+            name = affiliation_data.get('name', '')
+            if name not in cache and name not in new_affiliations:
+                new_affiliations[name] = Affiliation(
+                    name=name,
+                    identifier=affiliation_data.get('identifier', ''),
+                )
+        if new_affiliations:
+            Affiliation.objects.bulk_create(new_affiliations.values())
+            for name, affiliation in new_affiliations.items():
+                cache[name] = affiliation.pk
+
+        ContributorAffiliation.objects.bulk_create(
+            [
+                ContributorAffiliation(
+                    contributor_id=contributor_pk,
+                    affiliation_id=cache[affiliation_data.get('name', '')],
+                )
+                for contributor_pk, affiliation_data in pending
+            ],
+            ignore_conflicts=True,
+        )
+
     def _normalize_contributor_identifier(self, identifier):
-        """Normalize contributor identifier format"""
+        """Normalize contributor identifier format
+
+        ORCID URLs become the bare dashed ORCID (``0000-0002-1825-0097``) and ROR
+        ids become ``https://ror.org/<id>``; anything else is only stripped.
+        """
         if not identifier:
             return identifier
             
@@ -2739,27 +3431,14 @@ class Command(BaseCommand):
         identifier = identifier.strip()
         
         # Normalize ORCID URLs to standard format
-        if 'orcid.org' in identifier.lower():
-            # Extract ORCID from URL
-            if identifier.startswith('http'):
-                identifier = identifier.split('/')[-1]
-            # Ensure ORCID format
-            if not (identifier.startswith('0000-') or identifier.startswith('0009-')):
-                # Try to format as ORCID if it looks like one
-                if len(identifier) == 16 and identifier.replace('-', '').isdigit():
-                    pass  # Already formatted
-                elif len(identifier) == 16:
-                    # Add dashes if missing
-                    identifier = f"{identifier[:4]}-{identifier[4:8]}-{identifier[8:12]}-{identifier[12:]}"
-        
-        # Normalize ROR URLs to standard format  
-        elif 'ror.org' in identifier.lower():
-            # Extract ROR from URL
-            if identifier.startswith('http'):
-                identifier = identifier.split('/')[-1]
-            # Ensure ROR format starts with https://ror.org/
-            if not identifier.startswith('https://ror.org/'):
-                identifier = f"https://ror.org/{identifier}"
+        match = ORCID_URL_RE.search(identifier)
+        if match:
+            return '-'.join(match.groups()).upper()
+        
+        # Normalize ROR URLs to standard format
+        match = ROR_URL_RE.search(identifier)
+        if match:
+            return f"https://ror.org/{match.group(1)}"
         
         return identifier
 
@@ -2772,8 +3451,9 @@ class Command(BaseCommand):
                 raw_identifier = data.get('identifier', '')
                 normalized_identifier = self.normalize_uberon_identifier(raw_identifier)
                 
-                obj, _ = Anatomy.objects.get_or_create(
-                    name=data.get('name', ''),
+                obj = self._get_or_create_type(
+                    Anatomy,
+                    data.get('name', ''),
                     defaults={'identifier': normalized_identifier}
                 )
                 return obj, 'anatomy'
@@ -2785,26 +3465,40 @@ class Command(BaseCommand):
             return None, None
 
     def _load_access_requirements(self, data):
-        """Load access requirements from JSON data."""
+        """Load access requirements from JSON data.
+
+        Rows are looked up by status only, so they are cached by status; the
+        contact point is only resolved when a new row has to be created.
+        """
         try:
+            status = data.get('status', '')
+            access_req = self._access_requirements_cache.get(status)
+            if access_req is not None:
+                return access_req
+
             contact_point = None
             contact_point_data = data.get('contactPoint')
             if contact_point_data:
-                contact_point, _ = ContactPoint.objects.get_or_create(
-                    email=contact_point_data.get('email', ''),
-                    defaults={
-                        'url': contact_point_data.get('url', ''),
-                    }
-                )
+                email = contact_point_data.get('email', '')
+                contact_point = self._contact_point_cache.get(email)
+                if contact_point is None:
+                    contact_point, _ = ContactPoint.objects.get_or_create(
+                        email=email,
+                        defaults={
+                            'url': contact_point_data.get('url', ''),
+                        }
+                    )
+                    self._contact_point_cache[email] = contact_point
 
             access_req, _ = AccessRequirements.objects.get_or_create(
-                status=data.get('status', ''),
+                status=status,
                 defaults={
                     'contact_point': contact_point,
                     'description': data.get('description', ''),
-                    'embargoed_until': parse_datetime(data.get('embargoedUntil')) if data.get('embargoedUntil') else None,
+                    'embargoed_until': _parse_iso_datetime(data.get('embargoedUntil')),
                 }
             )
+            self._access_requirements_cache[status] = access_req
             return access_req
         except Exception as e:
             if self.verbose:
@@ -2843,57 +3537,29 @@ class Command(BaseCommand):
                 variable_measured=data.get('variableMeasured', []),
             )
 
-            # Load species
-            for species_data in data.get('species', []):
-                species, _ = SpeciesType.objects.get_or_create(
-                    name=species_data.get('name', ''),
-                    defaults={
-                        'identifier': species_data.get('identifier', ''),
-                    }
-                )
-                AssetsSummarySpecies.objects.get_or_create(
-                    assets_summary=assets_summary,
-                    species=species
-                )
-
-            # Load approaches
-            for approach_data in data.get('approach', []):
-                approach, _ = ApproachType.objects.get_or_create(
-                    name=approach_data.get('name', ''),
-                    defaults={
-                        'identifier': approach_data.get('identifier', ''),
-                    }
-                )
-                AssetsSummaryApproach.objects.get_or_create(
-                    assets_summary=assets_summary,
-                    approach=approach
-                )
-
-            # Load measurement techniques
-            for technique_data in data.get('measurementTechnique', []):
-                technique, _ = MeasurementTechniqueType.objects.get_or_create(
-                    name=technique_data.get('name', ''),
-                    defaults={
-                        'identifier': technique_data.get('identifier', ''),
-                    }
-                )
-                AssetsSummaryMeasurementTechnique.objects.get_or_create(
-                    assets_summary=assets_summary,
-                    measurement_technique=technique
-                )
-
-            # Load data standards
-            for standard_data in data.get('dataStandard', []):
-                standard, _ = StandardsType.objects.get_or_create(
-                    name=standard_data.get('name', ''),
-                    defaults={
-                        'identifier': standard_data.get('identifier', ''),
-                    }
-                )
-                AssetsSummaryDataStandard.objects.get_or_create(
-                    assets_summary=assets_summary,
-                    data_standard=standard
-                )
+            # The summary is brand new, so none of its link rows can exist
+            # yet: resolve each vocabulary term through the cache and insert
+            # the link rows in one bulk_create per table
+            link_specs = (
+                ('species', SpeciesType, AssetsSummarySpecies, 'species'),
+                ('approach', ApproachType, AssetsSummaryApproach, 'approach'),
+                ('measurementTechnique', MeasurementTechniqueType,
+                 AssetsSummaryMeasurementTechnique, 'measurement_technique'),
+                ('dataStandard', StandardsType, AssetsSummaryDataStandard, 'data_standard'),
+            )
+            for key, type_model, link_model, link_field in link_specs:
+                links = []
+                for item_data in data.get(key, []):
+                    item = self._get_or_create_type(
+                        type_model,
+                        item_data.get('name', ''),
+                        defaults={
+                            'identifier': item_data.get('identifier', ''),
+                        }
+                    )
+                    links.append(link_model(assets_summary=assets_summary, **{link_field: item}))
+                if links:
+                    link_model.objects.bulk_create(links, ignore_conflicts=True)
 
             return assets_summary
         except Exception as e:
@@ -2904,28 +3570,41 @@ class Command(BaseCommand):
     def _load_activity(self, data):
         """Load an activity from JSON data."""
         try:
-            activity, _ = Activity.objects.get_or_create(
-                name=data.get('name', ''),
-                defaults={
-                    'identifier': data.get('id', ''),
-                    'schema_key': data.get('schemaKey', ''),
-                    'description': data.get('description', ''),
-                    'start_date': parse_datetime(data.get('startDate')) if data.get('startDate') else None,
-                    'end_date': parse_datetime(data.get('endDate')) if data.get('endDate') else None,
-                }
-            )
-
-            # Load associated software - now using direct many-to-many relationship
-            for software_data in data.get('wasAssociatedWith', []):
-                software, _ = Software.objects.get_or_create(
-                    name=software_data.get('name', ''),
+            # Activities are looked up by name and repeat across assets, so
+            # each name only hits the database once per sync
+            name = data.get('name', '')
+            activity = self._activity_cache.get(name)
+            if activity is None:
+                activity, _ = Activity.objects.get_or_create(
+                    name=name,
                     defaults={
-                        'identifier': software_data.get('identifier', ''),
-                        'version': software_data.get('version', ''),
-                        'url': software_data.get('url', ''),
+                        'identifier': data.get('id', ''),
+                        'schema_key': data.get('schemaKey', ''),
+                        'description': data.get('description', ''),
+                        'start_date': _parse_iso_datetime(data.get('startDate')),
+                        'end_date': _parse_iso_datetime(data.get('endDate')),
                     }
                 )
-                activity.software.add(software)
+                self._activity_cache[name] = activity
+
+            # Load associated software - now using direct many-to-many relationship
+            software_list = []
+            for software_data in data.get('wasAssociatedWith', []):
+                software_name = software_data.get('name', '')
+                software = self._software_cache.get(software_name)
+                if software is None:
+                    software, _ = Software.objects.get_or_create(
+                        name=software_name,
+                        defaults={
+                            'identifier': software_data.get('identifier', ''),
+                            'version': software_data.get('version', ''),
+                            'url': software_data.get('url', ''),
+                        }
+                    )
+                    self._software_cache[software_name] = software
+                software_list.append(software)
+            if software_list:
+                activity.software.add(*software_list)
 
             return activity
         except Exception as e:
@@ -2936,12 +3615,20 @@ class Command(BaseCommand):
     def _load_participant(self, data):
         """Load a participant from JSON data."""
         try:
+            # Every asset of a subject carries the same participant, so only
+            # the first one looks it up
+            identifier = data.get('identifier', '')
+            participant = self._participant_cache.get(identifier)
+            if participant is not None:
+                return participant
+
             # Load species
             species = None
             species_data = data.get('species')
             if species_data:
-                species, _ = SpeciesType.objects.get_or_create(
-                    name=species_data.get('name', ''),
+                species = self._get_or_create_type(
+                    SpeciesType,
+                    species_data.get('name', ''),
                     defaults={
                         'identifier': species_data.get('identifier', ''),
                     }
@@ -2951,75 +3638,171 @@ class Command(BaseCommand):
             sex = None
             sex_data = data.get('sex')
             if sex_data:
-                sex, _ = SexType.objects.get_or_create(
-                    name=sex_data.get('name', ''),
+                sex = self._get_or_create_type(
+                    SexType,
+                    sex_data.get('name', ''),
                     defaults={
                         'identifier': sex_data.get('identifier', ''),
                     }
                 )
 
             participant, _ = Participant.objects.get_or_create(
-                identifier=data.get('identifier', ''),
+                identifier=identifier,
                 defaults={
                     'species': species,
                     'sex': sex,
                     'age': data.get('age'),
                 }
             )
+            self._participant_cache[identifier] = participant
             return participant
         except Exception as e:
             if self.verbose:
                 self.stdout.write(f"Error loading participant: {e}")
             return None
 
-    def _process_lindi_for_asset(self, asset, sync_tracker=None):
-        """Process LINDI metadata for a single NWB asset"""
-        try:
-            # Check if asset already has LINDI metadata (unless force refresh)
-            if hasattr(asset, 'lindi_metadata') and asset.lindi_metadata:
-                if self.verbose:
-                    self.stdout.write(f"Asset {asset.dandi_asset_id} already has LINDI metadata, skipping")
-                self.stats['lindi_skipped'] += 1
-                return
+    def _process_lindi_for_assets(self, assets, sync_tracker=None):
+        """Process LINDI metadata for NWB assets that are known to need it
 
-            # Construct LINDI URL
-            lindi_url = self._construct_lindi_url(asset)
-            if not lindi_url:
+        URLs are built and results saved on the calling thread, which owns the
+        database connection; downloading and filtering the LINDI files runs on
+        the worker pool so several files are in flight at once.
+        """
+        if not self.options.get('force_lindi_refresh'):
+            assets = self._exclude_known_missing_lindi(assets)
+        
+        lindi_urls = {}
+        base_ids = self._lindi_base_ids(assets)
+        for asset in assets:
+            lindi_url = self._construct_lindi_url(asset, base_ids)
+            if lindi_url:
+                lindi_urls[asset.pk] = lindi_url
+            else:
                 if self.verbose:
                     self.stdout.write(f"Could not construct LINDI URL for asset {asset.dandi_asset_id}")
-                self.stats['lindi_skipped'] += 1
-                return
+                self.stats.lindi_skipped += 1
+        
+        # Results are written in bulk rather than one upsert per asset
+        rows = []
+        not_found = []
+        to_fetch = [asset for asset in assets if asset.pk in lindi_urls]
+        fetched = self._iter_on_pool(lambda asset: self._fetch_lindi_metadata(lindi_urls[asset.pk]), to_fetch)
+        for asset, fetch in fetched:
+            try:
+                filtered_data = fetch()
+            except Exception as e:
+                filtered_data = None
+                if self.verbose:
+                    self.stdout.write(f"Error processing LINDI for asset {asset.dandi_asset_id}: {e}")
+            if filtered_data is LINDI_NOT_FOUND:
+                not_found.append(asset)
+                filtered_data = None
+            if filtered_data is None:
+                self.stats.lindi_errors += 1
+                continue
+            
+            if self.dry_run:
+                if self.verbose:
+                    self.stdout.write(f"Would process LINDI metadata for: {asset.dandi_asset_id}")
+                self.stats.lindi_processed += 1
+                continue
+            
+            rows.append((asset, lindi_urls[asset.pk], filtered_data))
+            if len(rows) >= self.batch_size:
+                self._save_lindi_metadata_batch(rows, sync_tracker)
+                rows = []
+        
+        if rows:
+            self._save_lindi_metadata_batch(rows, sync_tracker)
+        if not_found and not self.dry_run:
+            self._record_missing_lindi(not_found)
+
+    def _exclude_known_missing_lindi(self, assets):
+        """Drop assets whose LINDI file was found missing within LINDI_NOT_FOUND_RECHECK"""
+        cutoff = datetime.now(timezone.utc) - LINDI_NOT_FOUND_RECHECK
+        missing = set(
+            LindiNotFound.objects.filter(asset_id__in=[asset.pk for asset in assets], checked_at__gt=cutoff)
+            .values_list('asset_id', flat=True)
+        )
+        if not missing:
+            return assets
+        if self.verbose:
+            self.stdout.write(f"Skipping {len(missing)} assets with no LINDI file as of the last check")
+        self.stats.lindi_skipped += len(missing)
+        return [asset for asset in assets if asset.pk not in missing]
 
-            # Download and process LINDI file
-            lindi_data = self._download_lindi_file(lindi_url)
-            if not lindi_data:
-                self.stats['lindi_errors'] += 1
-                return
+    def _record_missing_lindi(self, assets):
+        """Remember that these assets have no LINDI file, refreshing the check time"""
+        checked_at = datetime.now(timezone.utc)
+        try:
+            LindiNotFound.objects.bulk_create(
+                [LindiNotFound(asset=asset, checked_at=checked_at) for asset in assets],
+                update_conflicts=True,
+                unique_fields=['asset'],
+                update_fields=['checked_at'],
+            )
+        except Exception as e:
+            # Only an optimization; the assets are simply requested again next time
+            if self.verbose:
+                self.stdout.write(f"Error recording missing LINDI files: {e}")
+
+    def _save_lindi_metadata_batch(self, rows, sync_tracker=None):
+        """Upsert LINDI metadata for `(asset, lindi_url, filtered_data)` rows and count the outcome"""
+        saved, failed = save_lindi_metadata_batch(
+            rows, sync_tracker, log=self.stdout.write if self.verbose else None
+        )
+        self.stats.lindi_processed += saved
+        self.stats.lindi_errors += failed
 
-            # Filter LINDI data
-            filtered_data = self._filter_lindi_data(lindi_data)
+    def _fetch_lindi_metadata(self, lindi_url):
+        """Download and filter a LINDI file
 
-            # Save to database
-            self._save_lindi_metadata(asset, lindi_url, lindi_data, filtered_data, sync_tracker)
-            self.stats['lindi_processed'] += 1
+        Returns None if it could not be downloaded, or LINDI_NOT_FOUND for a
+        404. Runs on worker threads, so it must not touch the database.
+        """
+        lindi_data = self._download_lindi_file(lindi_url)
+        if lindi_data is LINDI_NOT_FOUND:
+            return lindi_data
+        if not lindi_data:
+            return None
+        return self._filter_lindi_data(lindi_data)
 
-            if self.verbose:
-                self.stdout.write(f"Processed LINDI metadata for: {asset.path}")
+    def _iter_on_pool(self, func, items):
+        """Run `func` over `items` on the worker pool, yielding `(item, fetch)` in order
 
-        except Exception as e:
-            self.stats['lindi_errors'] += 1
-            if self.verbose:
-                self.stdout.write(f"Error processing LINDI for asset {asset.dandi_asset_id}: {e}")
+        `fetch()` returns the result or raises the call's exception. At most two
+        calls per worker are in flight, so results never pile up in memory
+        ahead of the consumer. Without a pool the calls run lazily inline.
+        """
+        if self.pool is None:
+            for item in items:
+                yield item, functools.partial(func, item)
+            return
+        
+        in_flight = deque()
+        for item in items:
+            in_flight.append((item, self.pool.submit(func, item).result))
+            if len(in_flight) >= self.max_workers * 2:
+                yield in_flight.popleft()
+        while in_flight:
+            yield in_flight.popleft()
+
+    def _construct_lindi_url(self, asset, base_ids=None):
+        """Construct the LINDI URL for an asset
 
-    def _construct_lindi_url(self, asset):
-        """Construct the LINDI URL for an asset"""
+        `base_ids` can be passed when the caller already looked up the
+        dandisets (see `_lindi_base_ids`); otherwise it is queried.
+        """
         try:
-            # Get dandiset ID from asset relationships
-            if not asset.dandisets.exists():
+            if base_ids is not None:
+                base_id = base_ids.get(asset.pk)
+            else:
+                # Get dandiset ID from asset relationships, in a single query
+                base_id = asset.dandisets.values_list('base_id', flat=True).first()
+            if not base_id:
                 return None
 
-            dandiset = asset.dandisets.first()
-            dandiset_id = dandiset.base_id.replace('DANDI:', '').zfill(6)
+            dandiset_id = base_id.replace('DANDI:', '').zfill(6)
 
             # Pattern: https://lindi.neurosift.org/dandi/dandisets/{dandiset_id}/assets/{asset_id}/nwb.lindi.json
             lindi_url = f"https://lindi.neurosift.org/dandi/dandisets/{dandiset_id}/assets/{asset.dandi_asset_id}/nwb.lindi.json"
@@ -3039,8 +3822,13 @@ class Command(BaseCommand):
 
             response = self.session.get(lindi_url, timeout=self.timeout)
             response.raise_for_status()
+            content = response.content
+
+            if self.verbose:
+                encoding = response.headers.get('Content-Encoding', 'identity')
+                self.stdout.write(f"Downloaded LINDI file ({len(content)} bytes, transfer encoding: {encoding}): {lindi_url}")
 
-            return response.json()
+            return loads_json(content)
 
         except requests.exceptions.Timeout:
             if self.verbose:
@@ -3050,6 +3838,7 @@ class Command(BaseCommand):
             if e.response.status_code == 404:
                 if self.verbose:
                     self.stdout.write(f"LINDI file not found: {lindi_url}")
+                return LINDI_NOT_FOUND
             else:
                 if self.verbose:
                     self.stdout.write(f"HTTP error downloading LINDI file {lindi_url}: {e}")
@@ -3067,28 +3856,28 @@ class Command(BaseCommand):
         """Filter LINDI data to remove base64-encoded values and large data arrays"""
         try:
             # Extract generation metadata and clean it
-            generation_metadata = self._clean_json_data(lindi_data.get('generationMetadata', {}))
+            generation_metadata = clean_json_data(lindi_data.get('generationMetadata', {}))
 
             # Filter refs data using the provided logic
             refs_data = lindi_data.get('refs', {})
             filtered_refs = {}
 
+            # This loop runs once per ref (often hundreds of thousands per
+            # file), so look the helpers up once and test each type once
+            clean = clean_json_data
+            is_problematic = has_problematic_unicode
             for key, val in refs_data.items():
-                # Skip base64-encoded values
-                if isinstance(val, str) and val.startswith("base64:"):
-                    continue
-
+                if isinstance(val, str):
+                    # Skip base64-encoded values and strings with problematic
+                    # Unicode escape sequences
+                    if val.startswith("base64:") or is_problematic(val):
+                        continue
                 # Skip array data that looks like [chunks, dtype, shape] format
-                if isinstance(val, list) and len(val) == 3:
-                    continue
-
-                # Skip strings with problematic Unicode escape sequences
-                if isinstance(val, str) and self._has_problematic_unicode(val):
+                elif isinstance(val, list) and len(val) == 3:
                     continue
 
                 # Clean the value and keep it
-                cleaned_val = self._clean_json_data(val)
-                filtered_refs[key] = cleaned_val
+                filtered_refs[key] = clean(val)
 
             if self.verbose:
                 original_count = len(refs_data)
@@ -3105,85 +3894,3 @@ class Command(BaseCommand):
             if self.verbose:
                 self.stdout.write(f"Error filtering LINDI data: {e}")
             return lindi_data  # Return original data if filtering fails
-
-    def _has_problematic_unicode(self, text):
-        """Check if text contains problematic Unicode escape sequences"""
-        if not isinstance(text, str):
-            return False
-
-        # Check for null bytes and other control characters
-        problematic_sequences = [
-            '\\u0000', '\\u0001', '\\u0002', '\\u0003', '\\u0004', '\\u0005',
-            '\\u0006', '\\u0007', '\\u0008', '\\u000b', '\\u000c', '\\u000e',
-            '\\u000f', '\\u0010', '\\u0011', '\\u0012', '\\u0013', '\\u0014',
-            '\\u0015', '\\u0016', '\\u0017', '\\u0018', '\\u0019', '\\u001a',
-            '\\u001b', '\\u001c', '\\u001d', '\\u001e', '\\u001f'
-        ]
-
-        return any(seq in text for seq in problematic_sequences)
-
-    def _clean_json_data(self, data):
-        """Recursively clean JSON data to remove problematic characters"""
-        if isinstance(data, dict):
-            cleaned = {}
-            for k, v in data.items():
-                # Clean the key
-                clean_key = self._clean_string(k) if isinstance(k, str) else k
-                # Clean the value recursively
-                clean_value = self._clean_json_data(v)
-                cleaned[clean_key] = clean_value
-            return cleaned
-        elif isinstance(data, list):
-            return [self._clean_json_data(item) for item in data]
-        elif isinstance(data, str):
-            return self._clean_string(data)
-        else:
-            return data
-
-    def _clean_string(self, text):
-        """Clean a string by removing or replacing problematic Unicode sequences"""
-        if not isinstance(text, str):
-            return text
-
-        # Replace null bytes and other control characters with empty string
-        import re
-        # Remove control characters (except normal whitespace: \t, \n, \r)
-        cleaned = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
-
-        # Also handle Unicode escape sequences in the string itself
-        problematic_patterns = [
-            r'\\u000[0-9a-fA-F]',  # \u0000 to \u000F
-            r'\\u001[0-9a-fA-F]',  # \u0010 to \u001F
-        ]
-
-        for pattern in problematic_patterns:
-            cleaned = re.sub(pattern, '', cleaned)
-
-        return cleaned
-
-    def _save_lindi_metadata(self, asset, lindi_url, original_data, filtered_data, sync_tracker=None):
-        """Save LINDI metadata to database"""
-        try:
-            with transaction.atomic():
-                # Create or update LindiMetadata record - store complete filtered data structure
-                lindi_metadata, created = LindiMetadata.objects.update_or_create(
-                    asset=asset,
-                    defaults={
-                        'structure_metadata': filtered_data,  # Complete filtered structure including generationMetadata
-                        'lindi_url': lindi_url,
-                        'processing_version': '1.0',
-                        'sync_tracker': sync_tracker,
-                    }
-                )
-
-                if created:
-                    if self.verbose:
-                        self.stdout.write(f"Created new LINDI metadata record for {asset.dandi_asset_id}")
-                else:
-                    if self.verbose:
-                        self.stdout.write(f"Updated existing LINDI metadata record for {asset.dandi_asset_id}")
-
-        except Exception as e:
-            if self.verbose:
-                self.stdout.write(f"Error saving LINDI metadata for {asset.dandi_asset_id}: {e}")
-            raise
@@ -1,12 +1,24 @@
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db.models import Prefetch
 from tqdm import tqdm
 
-from dandisets.models import Asset, LindiMetadata, SyncTracker, Dandiset
+from dandisets.management.commands._lindi import (
+    clean_json_data, has_problematic_unicode, loads_json, save_lindi_metadata_batch,
+)
+from dandisets.models import Asset, AssetDandiset, SyncTracker, Dandiset
+
+# LINDI files downloaded concurrently by default
+DEFAULT_MAX_WORKERS = 16
+
+# Fetched LINDI metadata is upserted in batches of this many rows
+LINDI_WRITE_BATCH_SIZE = 200
 
 
 class Command(BaseCommand):
@@ -24,6 +36,8 @@ class Command(BaseCommand):
         }
         self.dry_run = False
         self.verbose = False
+        # (asset, lindi_url, filtered_data) rows waiting for _flush_lindi_pending
+        self._lindi_pending = []
         self.session = requests.Session()
         # Set a reasonable timeout and user agent
         self.session.headers.update({
@@ -73,11 +87,21 @@ class Command(BaseCommand):
             default=30,
             help='HTTP timeout in seconds (default: 30)',
         )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=DEFAULT_MAX_WORKERS,
+            help=f'Number of LINDI files to download concurrently (default: {DEFAULT_MAX_WORKERS}, 1 disables)',
+        )
 
     def handle(self, *args, **options):
         self.dry_run = options['dry_run']
         self.verbose = options['verbose']
         self.no_progress = options['no_progress']
+        # Download workers share the session; size its pool so their
+        # connections are reused rather than discarded
+        pool_size = max(10, (options.get('max_workers') or DEFAULT_MAX_WORKERS) * 2)
+        self.session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
         
         start_time = time.time()
         sync_tracker = None
@@ -115,7 +139,7 @@ class Command(BaseCommand):
                 assets_queryset = assets_queryset[:max_assets]
             
             # Process assets
-            self._process_assets(assets_queryset, options, sync_tracker)
+            self._process_assets(assets_queryset, options, sync_tracker, total=min(total_assets, max_assets))
             
             # Record sync completion
             end_time = time.time()
@@ -156,13 +180,18 @@ class Command(BaseCommand):
             if not dandiset_id.startswith('DANDI:'):
                 dandiset_id = f"DANDI:{dandiset_id.zfill(6)}"
             
-            queryset = queryset.filter(dandisets__base_id=dandiset_id)
+            # Match through a subquery: an asset is linked to every version
+            # of its dandiset, so a join would return it once per version
+            queryset = queryset.filter(pk__in=AssetDandiset.objects.filter(
+                dandiset__base_id=dandiset_id
+            ).values('asset_id'))
         
         # Filter by specific asset if specified
         if options['asset_id']:
             queryset = queryset.filter(dandi_asset_id=options['asset_id'])
         
-        # Skip assets that already have LINDI metadata unless force refresh
+        # Skip assets that already have LINDI metadata unless force refresh.
+        # This is the only existence check, so no per-asset query is needed
         if not options['force_refresh']:
             queryset = queryset.filter(lindi_metadata__isnull=True)
         
@@ -171,9 +200,15 @@ class Command(BaseCommand):
         if not options['force_refresh'] and not options['asset_id'] and not options['dandiset_id']:
             updated_dandisets = self._get_updated_dandisets_since_last_sync()
             if updated_dandisets is not None:
-                queryset = queryset.filter(dandisets__base_id__in=updated_dandisets)
+                queryset = queryset.filter(pk__in=AssetDandiset.objects.filter(
+                    dandiset__base_id__in=updated_dandisets
+                ).values('asset_id'))
         
-        return queryset.select_related().prefetch_related('dandisets')
+        # Only the asset columns and dandiset base_ids used to build LINDI URLs
+        # are loaded; the dandisets come in one prefetch query per chunk
+        return queryset.only('id', 'dandi_asset_id').prefetch_related(
+            Prefetch('dandisets', queryset=Dandiset.objects.only('id', 'base_id'))
+        )
 
     def _get_updated_dandisets_since_last_sync(self):
         """Get list of dandiset base_ids that have been updated since the last LINDI sync"""
@@ -218,33 +253,55 @@ class Command(BaseCommand):
                 self.stdout.write(f"Error checking for updated dandisets: {e}")
             return None  # On error, process all to be safe
 
-    def _process_assets(self, assets_queryset, options, sync_tracker=None):
-        """Process the assets for LINDI metadata"""
-        
+    def _process_assets(self, assets_queryset, options, sync_tracker=None, total=None):
+        """Process the assets for LINDI metadata
+
+        LINDI files are downloaded and filtered on a pool of worker threads,
+        with at most two per worker in flight. URLs are built and results
+        saved on this thread, which owns the database connection.
+        """
+        max_workers = max(1, options.get('max_workers') or DEFAULT_MAX_WORKERS)
         process_desc = "Processing NWB assets for LINDI metadata"
-        if self.no_progress:
-            for asset in assets_queryset:
-                self._process_single_asset(asset, sync_tracker)
+        in_flight = deque()
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='lindi-sync') as pool, \
+                tqdm(total=total, desc=process_desc, unit="asset", disable=self.no_progress) as pbar:
+            
+            def finish_asset(asset, lindi_url, future):
+                self._save_fetched_asset(asset, lindi_url, future, sync_tracker)
                 self.stats['assets_checked'] += 1
-        else:
-            with tqdm(assets_queryset, desc=process_desc, unit="asset") as pbar:
-                for asset in pbar:
-                    # Get dandiset info for display
-                    dandiset_info = "no-dandiset"
-                    if asset.dandisets.exists():
-                        dandiset_info = asset.dandisets.first().base_id.replace('DANDI:', '')
+                pbar.update(1)
+            
+            for asset in assets_queryset:
+                if not self.no_progress:
+                    # Get dandiset info for display, from the prefetched dandisets
+                    dandisets = asset.dandisets.all()
+                    dandiset_info = dandisets[0].base_id.replace('DANDI:', '') if dandisets else "no-dandiset"
                     
                     pbar.set_postfix(
                         dandiset=dandiset_info,
                         processed=self.stats['lindi_processed'],
-                        errors=self.stats['errors']
+                        errors=self.stats['errors'],
+                        refresh=False,
                     )
-                    
-                    self._process_single_asset(asset, sync_tracker)
+                
+                lindi_url = self._prepare_asset(asset)
+                if lindi_url is None:
                     self.stats['assets_checked'] += 1
+                    pbar.update(1)
+                    continue
+                
+                in_flight.append((asset, lindi_url, pool.submit(self._fetch_lindi_metadata, lindi_url)))
+                if len(in_flight) >= max_workers * 2:
+                    finish_asset(*in_flight.popleft())
+            
+            while in_flight:
+                finish_asset(*in_flight.popleft())
+        
+        self._flush_lindi_pending(sync_tracker)
 
-    def _process_single_asset(self, asset, sync_tracker=None):
-        """Process a single asset for LINDI metadata"""
+    def _prepare_asset(self, asset):
+        """Return the LINDI URL to download for an asset, or None if it is skipped"""
         try:
             # Construct LINDI URL
             lindi_url = self._construct_lindi_url(asset)
@@ -252,41 +309,42 @@ class Command(BaseCommand):
                 if self.verbose:
                     self.stdout.write(f"Could not construct LINDI URL for asset {asset.dandi_asset_id}")
                 self.stats['lindi_skipped'] += 1
-                return
-            
-            # Check if we should process this asset
-            should_process = True
-            if hasattr(asset, 'lindi_metadata') and asset.lindi_metadata:
-                if self.verbose:
-                    self.stdout.write(f"Asset {asset.dandi_asset_id} already has LINDI metadata")
-                self.stats['lindi_skipped'] += 1
-                should_process = False
-            
-            if not should_process:
-                return
+                return None
             
             if self.dry_run:
                 if self.verbose:
-                    self.stdout.write(f"Would process LINDI for asset: {asset.path}")
+                    self.stdout.write(f"Would process LINDI for asset: {asset.dandi_asset_id}")
                     self.stdout.write(f"  URL: {lindi_url}")
                 self.stats['lindi_processed'] += 1
-                return
+                return None
             
-            # Download and process LINDI file
-            lindi_data = self._download_lindi_file(lindi_url)
-            if not lindi_data:
+            return lindi_url
+        
+        except Exception as e:
+            self.stats['errors'] += 1
+            if self.verbose:
+                self.stdout.write(f"Error processing asset {asset.dandi_asset_id}: {e}")
+            return None
+
+    def _fetch_lindi_metadata(self, lindi_url):
+        """Download and filter a LINDI file; runs on worker threads, so no database access"""
+        lindi_data = self._download_lindi_file(lindi_url)
+        if not lindi_data:
+            return None
+        return self._filter_lindi_data(lindi_data)
+
+    def _save_fetched_asset(self, asset, lindi_url, future, sync_tracker=None):
+        """Save the result of a `_fetch_lindi_metadata` future for an asset"""
+        try:
+            filtered_data = future.result()
+            if filtered_data is None:
                 self.stats['errors'] += 1
                 return
             
-            # Filter LINDI data
-            filtered_data = self._filter_lindi_data(lindi_data)
-            
-            # Save to database
-            self._save_lindi_metadata(asset, lindi_url, lindi_data, filtered_data, sync_tracker)
-            self.stats['lindi_processed'] += 1
-            
-            if self.verbose:
-                self.stdout.write(f"Processed LINDI metadata for: {asset.path}")
+            # Queue for the next bulk save
+            self._lindi_pending.append((asset, lindi_url, filtered_data))
+            if len(self._lindi_pending) >= LINDI_WRITE_BATCH_SIZE:
+                self._flush_lindi_pending(sync_tracker)
                 
         except Exception as e:
             self.stats['errors'] += 1
@@ -296,12 +354,12 @@ class Command(BaseCommand):
     def _construct_lindi_url(self, asset):
         """Construct the LINDI URL for an asset"""
         try:
-            # Get dandiset ID
-            if not asset.dandisets.exists():
+            # Get dandiset ID; all() is served from the queryset's prefetch
+            dandisets = asset.dandisets.all()
+            if not dandisets:
                 return None
             
-            dandiset = asset.dandisets.first()
-            dandiset_id = dandiset.base_id.replace('DANDI:', '').zfill(6)
+            dandiset_id = dandisets[0].base_id.replace('DANDI:', '').zfill(6)
             
             # Use draft version for URL construction
             # Pattern: https://lindi.neurosift.org/dandi/dandisets/{dandiset_id}/assets/{asset_id}/nwb.lindi.json
@@ -323,7 +381,7 @@ class Command(BaseCommand):
             response = self.session.get(lindi_url, timeout=self.timeout)
             response.raise_for_status()
             
-            return response.json()
+            return loads_json(response.content)
             
         except requests.exceptions.Timeout:
             if self.verbose:
@@ -350,7 +408,7 @@ class Command(BaseCommand):
         """Filter LINDI data to remove base64-encoded values and large data arrays"""
         try:
             # Extract generation metadata and clean it
-            generation_metadata = self._clean_json_data(lindi_data.get('generationMetadata', {}))
+            generation_metadata = clean_json_data(lindi_data.get('generationMetadata', {}))
             
             # Filter refs data using the provided logic
             refs_data = lindi_data.get('refs', {})
@@ -366,11 +424,11 @@ class Command(BaseCommand):
                     continue
                 
                 # Skip strings with problematic Unicode escape sequences
-                if isinstance(val, str) and self._has_problematic_unicode(val):
+                if isinstance(val, str) and has_problematic_unicode(val):
                     continue
                 
                 # Clean the value and keep it
-                cleaned_val = self._clean_json_data(val)
+                cleaned_val = clean_json_data(val)
                 filtered_refs[key] = cleaned_val
             
             if self.verbose:
@@ -389,87 +447,19 @@ class Command(BaseCommand):
                 self.stdout.write(f"Error filtering LINDI data: {e}")
             return lindi_data  # Return original data if filtering fails
 
-    def _has_problematic_unicode(self, text):
-        """Check if text contains problematic Unicode escape sequences"""
-        if not isinstance(text, str):
-            return False
-        
-        # Check for null bytes and other control characters
-        problematic_sequences = [
-            '\\u0000', '\\u0001', '\\u0002', '\\u0003', '\\u0004', '\\u0005', 
-            '\\u0006', '\\u0007', '\\u0008', '\\u000b', '\\u000c', '\\u000e', 
-            '\\u000f', '\\u0010', '\\u0011', '\\u0012', '\\u0013', '\\u0014', 
-            '\\u0015', '\\u0016', '\\u0017', '\\u0018', '\\u0019', '\\u001a', 
-            '\\u001b', '\\u001c', '\\u001d', '\\u001e', '\\u001f'
-        ]
-        
-        return any(seq in text for seq in problematic_sequences)
-
-    def _clean_json_data(self, data):
-        """Recursively clean JSON data to remove problematic characters"""
-        if isinstance(data, dict):
-            cleaned = {}
-            for k, v in data.items():
-                # Clean the key
-                clean_key = self._clean_string(k) if isinstance(k, str) else k
-                # Clean the value recursively
-                clean_value = self._clean_json_data(v)
-                cleaned[clean_key] = clean_value
-            return cleaned
-        elif isinstance(data, list):
-            return [self._clean_json_data(item) for item in data]
-        elif isinstance(data, str):
-            return self._clean_string(data)
-        else:
-            return data
-
-    def _clean_string(self, text):
-        """Clean a string by removing or replacing problematic Unicode sequences"""
-        if not isinstance(text, str):
-            return text
-        
-        # Replace null bytes and other control characters with empty string
-        import re
-        # Remove control characters (except normal whitespace: \t, \n, \r)
-        cleaned = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
-        
-        # Also handle Unicode escape sequences in the string itself
-        problematic_patterns = [
-            r'\\u000[0-9a-fA-F]',  # \u0000 to \u000F
-            r'\\u001[0-9a-fA-F]',  # \u0010 to \u001F
-        ]
-        
-        for pattern in problematic_patterns:
-            cleaned = re.sub(pattern, '', cleaned)
-        
-        return cleaned
+    def _flush_lindi_pending(self, sync_tracker=None):
+        """Save the queued LINDI metadata with one bulk upsert"""
+        rows, self._lindi_pending = self._lindi_pending, []
+        if rows:
+            self._save_lindi_metadata_batch(rows, sync_tracker)
 
-    def _save_lindi_metadata(self, asset, lindi_url, original_data, filtered_data, sync_tracker=None):
-        """Save LINDI metadata to database"""
-        try:
-            with transaction.atomic():
-                # Create or update LindiMetadata record - store complete filtered data structure
-                lindi_metadata, created = LindiMetadata.objects.update_or_create(
-                    asset=asset,
-                    defaults={
-                        'structure_metadata': filtered_data,  # Complete filtered structure including generationMetadata
-                        'lindi_url': lindi_url,
-                        'processing_version': '1.0',
-                        'sync_tracker': sync_tracker,
-                    }
-                )
-                
-                if created:
-                    if self.verbose:
-                        self.stdout.write(f"Created new LINDI metadata record for {asset.dandi_asset_id}")
-                else:
-                    if self.verbose:
-                        self.stdout.write(f"Updated existing LINDI metadata record for {asset.dandi_asset_id}")
-                
-        except Exception as e:
-            if self.verbose:
-                self.stdout.write(f"Error saving LINDI metadata for {asset.dandi_asset_id}: {e}")
-            raise
+    def _save_lindi_metadata_batch(self, rows, sync_tracker=None):
+        """Upsert LINDI metadata for `(asset, lindi_url, filtered_data)` rows and count the outcome"""
+        saved, failed = save_lindi_metadata_batch(
+            rows, sync_tracker, log=self.stdout.write if self.verbose else None
+        )
+        self.stats['lindi_processed'] += saved
+        self.stats['errors'] += failed
 
     def _record_sync_completion(self, sync_tracker, duration):
         """Record sync completion in database"""
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.3 on 2026-10-17 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dandisets', '0010_add_model_documentation'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activity',
+            name='name',
+            field=models.CharField(db_index=True, help_text='The name of the activity', max_length=150),
+        ),
+        migrations.AlterField(
+            model_name='contributor',
+            name='email',
+            field=models.EmailField(blank=True, db_index=True, help_text='Email address of the contributor', max_length=254, null=True),
+        ),
+        migrations.AlterField(
+            model_name='contributor',
+            name='identifier',
+            field=models.TextField(blank=True, db_index=True, help_text='Use a common identifier such as ORCID for people or ROR for institutions', null=True),
+        ),
+        migrations.AlterField(
+            model_name='contributor',
+            name='name',
+            field=models.TextField(blank=True, db_index=True, help_text='Full name of the person or organization', null=True),
+        ),
+        migrations.AlterField(
+            model_name='participant',
+            name='identifier',
+            field=models.CharField(db_index=True, help_text='Subject ID', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='software',
+            name='name',
+            field=models.TextField(db_index=True, help_text='Name of the software'),
+        ),
+    ]
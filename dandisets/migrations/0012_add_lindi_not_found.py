@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-17 00:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dandisets', '0011_add_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LindiNotFound',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('checked_at', models.DateTimeField(help_text='When the LINDI file was last requested and not found')),
+                ('asset', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='lindi_not_found', to='dandisets.asset')),
+            ],
+            options={
+                'verbose_name': 'LINDI Not Found',
+                'verbose_name_plural': 'LINDI Not Found',
+                'db_table_comment': 'NWB assets with no LINDI file on lindi.neurosift.org as of the last check',
+            },
+        ),
+    ]
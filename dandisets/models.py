@@ -124,9 +124,9 @@ class Contributor(models.Model):
         ('Contributor', 'Contributor'),
     ]
     
-    identifier = models.TextField(blank=True, null=True, help_text="Use a common identifier such as ORCID for people or ROR for institutions")
-    name = models.TextField(blank=True, null=True, help_text="Full name of the person or organization")
-    email = models.EmailField(blank=True, null=True, help_text="Email address of the contributor")
+    identifier = models.TextField(blank=True, null=True, db_index=True, help_text="Use a common identifier such as ORCID for people or ROR for institutions")
+    name = models.TextField(blank=True, null=True, db_index=True, help_text="Full name of the person or organization")
+    email = models.EmailField(blank=True, null=True, db_index=True, help_text="Email address of the contributor")
     url = models.URLField(blank=True, null=True, help_text="Web page for the contributor (personal page, organization website)")
     award_number = models.TextField(blank=True, null=True, help_text="Identifier associated with a sponsored or gift award")
     schema_key = models.CharField(max_length=20, choices=SCHEMA_KEY_CHOICES, default='Contributor', help_text="Type of contributor (Person, Organization, or Contributor)")
@@ -152,7 +152,7 @@ class ContributorAffiliation(models.Model):
 class Software(models.Model):
     """Software information"""
     identifier = models.TextField(blank=True, null=True, help_text="RRID of the software from scicrunch.org")
-    name = models.TextField(help_text="Name of the software")
+    name = models.TextField(db_index=True, help_text="Name of the software")
     version = models.CharField(max_length=100, help_text="Version number or string of the software")
     url = models.URLField(blank=True, null=True, help_text="Web page for the software")
     
@@ -199,7 +199,7 @@ class Activity(models.Model):
     ]
     
     identifier = models.TextField(blank=True, null=True, help_text="Unique identifier for the activity")
-    name = models.CharField(max_length=150, help_text="The name of the activity")
+    name = models.CharField(max_length=150, db_index=True, help_text="The name of the activity")
     description = models.TextField(blank=True, null=True, help_text="The description of the activity")
     start_date = models.DateTimeField(blank=True, null=True, help_text="When the activity started")
     end_date = models.DateTimeField(blank=True, null=True, help_text="When the activity ended")
@@ -530,7 +530,7 @@ class DandisetWasGeneratedBy(models.Model):
 
 class Participant(models.Model):
     """Participant/subject information"""
-    identifier = models.CharField(max_length=100, help_text="Subject ID")
+    identifier = models.CharField(max_length=100, db_index=True, help_text="Subject ID")
     species = models.ForeignKey(SpeciesType, on_delete=models.CASCADE, blank=True, null=True, help_text="Species of the experimental subject")
     sex = models.ForeignKey(SexType, on_delete=models.CASCADE, blank=True, null=True, help_text="Biological sex of the experimental subject")
     age = models.JSONField(blank=True, null=True, help_text="Age information with value and unit")
@@ -699,3 +699,17 @@ class LindiMetadata(models.Model):
     def asset_id(self):
         """Get the asset ID"""
         return self.asset.dandi_asset_id
+
+
+class LindiNotFound(models.Model):
+    """NWB assets whose LINDI file was not found, so syncs can skip re-requesting it"""
+    asset = models.OneToOneField(Asset, on_delete=models.CASCADE, related_name='lindi_not_found')
+    checked_at = models.DateTimeField(help_text="When the LINDI file was last requested and not found")
+    
+    class Meta:
+        verbose_name = "LINDI Not Found"
+        verbose_name_plural = "LINDI Not Found"
+        db_table_comment = "NWB assets with no LINDI file on lindi.neurosift.org as of the last check"
+    
+    def __str__(self):
+        return f"No LINDI file for asset {self.asset_id} (checked {self.checked_at})"
@@ -11,11 +11,19 @@ Test Strategy:
 - Test error handling and edge cases
 """
 
-from django.test import TestCase, Client
+from django.test import SimpleTestCase, TestCase, Client
 from django.conf import settings
+from django.db import models
+from datetime import datetime, timezone
 import os
+import yaml
 
-from .models import Dandiset, Asset, AssetDandiset
+from .management.commands._lindi import save_lindi_metadata_batch
+from .management.commands.sync_dandi_incremental import (
+    YamlLoader, _compose_yaml_node, _copy_text_value, _iter_yaml_sequence,
+)
+from .management.commands.sync_lindi_metadata import Command as SyncLindiMetadataCommand
+from .models import Dandiset, Asset, AssetDandiset, LindiMetadata
 
 
 class PublishedDandisetTestCase(TestCase):
@@ -415,6 +423,66 @@ class ModelTests(PublishedDandisetTestCase):
         self.assertEqual(AssetDandiset.objects.filter(asset=asset, dandiset=dandiset).count(), 1)
 
 
+class SyncLindiMetadataTests(TestCase):
+    """Test the asset selection of the sync_lindi_metadata command"""
+
+    def test_assets_queryset_builds_lindi_urls(self):
+        """Test that the deferred, prefetched assets queryset can be iterated"""
+        dandiset = Dandiset.objects.create(
+            dandi_id="DANDI:000999/draft",
+            identifier="DANDI:000999",
+            name="Test Dataset",
+            description="Test description",
+            is_draft=True,
+        )
+        asset = Asset.objects.create(
+            dandi_asset_id="test_asset_id",
+            identifier="test_asset",
+            content_size=1024,
+            encoding_format="application/x-nwb",
+            digest={"sha256": "abc123"}
+        )
+        AssetDandiset.objects.create(asset=asset, dandiset=dandiset, path="sub-01/sub-01.nwb")
+
+        command = SyncLindiMetadataCommand()
+        queryset = command._get_assets_queryset({
+            'dandiset_id': '000999',
+            'asset_id': None,
+            'force_refresh': True,
+        })
+
+        self.assertEqual(queryset.count(), 1)
+        assets = list(queryset)
+        self.assertEqual([a.dandi_asset_id for a in assets], ["test_asset_id"])
+        with self.assertNumQueries(0):
+            lindi_url = command._construct_lindi_url(assets[0])
+        self.assertEqual(
+            lindi_url,
+            "https://lindi.neurosift.org/dandi/dandisets/000999/assets/test_asset_id/nwb.lindi.json"
+        )
+
+    def test_save_lindi_metadata_batch_upserts(self):
+        """Test that a repeated save updates the row and logs each asset"""
+        asset = Asset.objects.create(
+            dandi_asset_id="test_asset_id",
+            identifier="test_asset",
+            content_size=1024,
+            encoding_format="application/x-nwb",
+            digest={"sha256": "abc123"}
+        )
+        messages = []
+
+        saved = save_lindi_metadata_batch([(asset, "first_url", {"refs": {}})], log=messages.append)
+        self.assertEqual(saved, (1, 0))
+        saved = save_lindi_metadata_batch([(asset, "second_url", {"refs": {"a": 1}})], log=messages.append)
+        self.assertEqual(saved, (1, 0))
+
+        lindi_metadata = LindiMetadata.objects.get(asset=asset)
+        self.assertEqual(lindi_metadata.lindi_url, "second_url")
+        self.assertEqual(lindi_metadata.structure_metadata, {"refs": {"a": 1}})
+        self.assertEqual(messages, ["Processed LINDI metadata for: test_asset_id"] * 2)
+
+
 class PerformanceTests(PublishedDandisetTestCase):
     """Test query performance with realistic data"""
     
@@ -570,6 +638,106 @@ class RegressionTests(PublishedDandisetTestCase):
             self.fail("Expected to find mouse or human species data in real database")
 
 
+class StreamedYamlTests(SimpleTestCase):
+    """Test that the streamed YAML sequence reader matches yaml.load"""
+
+    def assertMatchesYamlLoad(self, source):
+        self.assertEqual(list(_iter_yaml_sequence(source)), yaml.load(source, Loader=YamlLoader))
+
+    def test_plain_sequence(self):
+        """Test a list of mappings, scalars and nested lists"""
+        self.assertMatchesYamlLoad(
+            "- path: sub-01/sub-01.nwb\n"
+            "  contentSize: 1024\n"
+            "  dateModified: 2023-06-29T19:55:00Z\n"
+            "- [1, 2.5, true, null]\n"
+            "- plain string\n"
+        )
+
+    def test_anchors_and_aliases(self):
+        """Test aliases to anchors defined in earlier entries"""
+        self.assertMatchesYamlLoad(
+            "- &species {name: Mus musculus, identifier: NCBITaxon_10090}\n"
+            "- species: *species\n"
+            "- &tags [a, b]\n"
+            "- *tags\n"
+            "- &name Homo sapiens\n"
+            "- *name\n"
+        )
+
+    def test_merge_keys(self):
+        """Test << merge keys, including overrides and merged lists"""
+        self.assertMatchesYamlLoad(
+            "- &base {encodingFormat: application/x-nwb, contentSize: 1}\n"
+            "- <<: *base\n"
+            "  contentSize: 2\n"
+            "- &extra {schemaVersion: 0.6.4}\n"
+            "- <<: [*base, *extra]\n"
+            "  path: a.nwb\n"
+        )
+
+    def test_empty_and_null_documents(self):
+        """Test that empty and null documents yield no entries"""
+        for source in ("", "\n", "# comment only\n", "null\n", "~\n", "---\n...\n"):
+            with self.subTest(source=source):
+                self.assertEqual(list(_iter_yaml_sequence(source)), [])
+
+    def test_empty_sequence(self):
+        """Test an empty flow sequence"""
+        self.assertEqual(list(_iter_yaml_sequence("[]\n")), [])
+
+    def test_mapping_root_raises(self):
+        """Test that a non-list document root raises ValueError"""
+        for source in ("path: a.nwb\n", "just a string\n"):
+            with self.subTest(source=source):
+                with self.assertRaises(ValueError):
+                    list(_iter_yaml_sequence(source))
+
+    def test_compose_yaml_node(self):
+        """Test composing a single node with an alias back to its anchor"""
+        loader = YamlLoader("- &a {x: 1}\n- *a\n")
+        try:
+            loader.get_event()  # StreamStartEvent
+            loader.get_event()  # DocumentStartEvent
+            anchors = {}
+            node = _compose_yaml_node(loader, anchors)
+            self.assertIsInstance(node, yaml.SequenceNode)
+            self.assertIs(node.value[1], anchors['a'])
+            self.assertEqual(loader.construct_document(node), [{'x': 1}, {'x': 1}])
+        finally:
+            loader.dispose()
+
+
+class CopyTextValueTests(SimpleTestCase):
+    """Test encoding of field values for COPY ... FROM STDIN text format"""
+
+    def test_null(self):
+        """Test that None becomes \\N except in a non-nullable JSON field"""
+        self.assertEqual(_copy_text_value(models.CharField(null=True), None), '\\N')
+        self.assertEqual(_copy_text_value(models.JSONField(null=True), None), '\\N')
+        self.assertEqual(_copy_text_value(models.JSONField(), None), 'null')
+
+    def test_json(self):
+        """Test that JSON values are serialized and then escaped"""
+        field = models.JSONField()
+        self.assertEqual(_copy_text_value(field, {'sha256': 'abc'}), '{"sha256": "abc"}')
+        self.assertEqual(_copy_text_value(field, []), '[]')
+        self.assertEqual(_copy_text_value(field, {'a': 'x\ny'}), '{"a": "x\\\\ny"}')
+
+    def test_datetime(self):
+        """Test that datetimes are written in ISO format"""
+        value = datetime(2023, 6, 29, 19, 55, tzinfo=timezone.utc)
+        self.assertEqual(_copy_text_value(models.DateTimeField(), value), '2023-06-29T19:55:00+00:00')
+
+    def test_escapes(self):
+        """Test escaping of backslashes and tab, newline and carriage return"""
+        field = models.CharField()
+        self.assertEqual(_copy_text_value(field, 'a\\b'), 'a\\\\b')
+        self.assertEqual(_copy_text_value(field, 'a\tb\nc\rd'), 'a\\tb\\nc\\rd')
+        self.assertEqual(_copy_text_value(field, 'sub-01/sub-01.nwb'), 'sub-01/sub-01.nwb')
+        self.assertEqual(_copy_text_value(field, 1024), '1024')
+
+
 if __name__ == '__main__':
     import django
     from django.conf import settings